@@ -3,6 +3,7 @@ from typing import Dict, Any, List, Optional
 import litellm
 import json
 import logging
+import time
 from datetime import datetime
 from asgiref.sync import sync_to_async
 
@@ -50,7 +51,7 @@ class BaseAgent(ABC):
         Returns:
             Dict with execution results
         """
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
             logger.info(f"{self.name} received command: {command}")
@@ -78,7 +79,7 @@ class BaseAgent(ABC):
             result = await self._execute_plan(plan, task)
             
             # Step 5: Finalize
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             await self._log_execution(task, result, execution_time)
             
             logger.info(f"{self.name} completed task in {execution_time:.2f}s")
@@ -94,7 +95,7 @@ class BaseAgent(ABC):
         except Exception as e:
             logger.error(f"{self.name} error: {str(e)}", exc_info=True)
             
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             error_result = {
                 "success": False,
                 "agent": self.name,
@@ -0,0 +1,140 @@
+"""
+Shared Browser Pool
+===================
+
+Keeps one Playwright driver and one browser process alive for the whole
+Python process. Automation classes borrow lightweight BrowserContexts from
+the shared browser instead of launching their own Chrome, so many
+concurrent posts (e.g. from the REST API) run on a single browser.
+
+All state belongs to the event loop that created it. When a call arrives on
+a different loop (e.g. each async_to_sync() call under WSGI or Celery runs a
+fresh one), the old driver and browser are dropped and relaunched.
+
+Usage:
+    browser = await get_browser(launch)     # launch(playwright) -> Browser
+    context = await acquire_context(browser, viewport=...)
+    ...
+    await release_context(context)
+    await shutdown_pool()                   # once, on process exit
+    await shutdown_pool(only_if_idle=True)  # after a unit of work; keeps it up while others use it
+"""
+
+import asyncio
+import os
+import logging
+from typing import Awaitable, Callable, Optional
+from playwright.async_api import async_playwright, Browser, BrowserContext, Playwright
+
+logger = logging.getLogger('allisson')
+
+_MAX_CONTEXTS = int(os.getenv('ALLISSON_MAX_CTX', '8'))
+
+_loop: Optional[asyncio.AbstractEventLoop] = None  # Loop the state below belongs to
+_playwright: Optional[Playwright] = None
+_browser: Optional[Browser] = None
+_lock = asyncio.Lock()
+
+# Caps the number of live contexts on the shared browser
+_context_sem = asyncio.Semaphore(_MAX_CONTEXTS)
+_live_contexts = 0  # Contexts acquired and not yet released, including ones being created
+
+
+def _bind_loop():
+    """Reset the pool if it was created on another (possibly closed) event loop."""
+    global _loop, _playwright, _browser, _lock, _context_sem, _live_contexts
+    loop = asyncio.get_running_loop()
+    if loop is _loop:
+        return
+    if _browser is not None or _playwright is not None:
+        # Its driver pipe is tied to the old loop and can't be closed from here;
+        # dropping the references closes the pipe, and the driver exits with its browser
+        logger.info("Event loop changed, relaunching the shared browser")
+    _loop = loop
+    _playwright = None
+    _browser = None
+    _lock = asyncio.Lock()
+    _context_sem = asyncio.Semaphore(_MAX_CONTEXTS)
+    _live_contexts = 0
+
+
+async def get_playwright() -> Playwright:
+    """Return the shared Playwright driver, starting it on first use."""
+    global _playwright
+    _bind_loop()
+    async with _lock:
+        if _playwright is None:
+            _playwright = await async_playwright().start()
+    return _playwright
+
+
+async def get_browser(launch: Callable[[Playwright], Awaitable[Browser]]) -> Browser:
+    """
+    Return the shared browser, launching it on first use.
+
+    Args:
+        launch: Coroutine function that launches a browser from a Playwright
+                instance. Only called when no live browser exists, so the
+                first caller's launch settings apply to the whole process.
+    """
+    global _playwright, _browser
+    _bind_loop()
+    async with _lock:
+        if _browser is None or not _browser.is_connected():
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            _browser = await launch(_playwright)
+            logger.info("Shared browser launched")
+    return _browser
+
+
+async def acquire_context(browser: Browser, **kwargs) -> BrowserContext:
+    """Create a new context on `browser`, waiting while the pool is full."""
+    global _live_contexts
+    _bind_loop()
+    # Counted before the first await, so an idle shutdown can't slip in between
+    # a caller's get_browser() and its context
+    _live_contexts += 1
+    try:
+        await _context_sem.acquire()
+    except BaseException:
+        _live_contexts -= 1
+        raise
+    try:
+        return await browser.new_context(**kwargs)
+    except BaseException:
+        _live_contexts -= 1
+        _context_sem.release()
+        raise
+
+
+async def release_context(context: BrowserContext):
+    """Close a context created by acquire_context() and free its slot."""
+    global _live_contexts
+    try:
+        await context.close()
+    finally:
+        _live_contexts = max(0, _live_contexts - 1)
+        _context_sem.release()
+
+
+async def shutdown_pool(only_if_idle: bool = False):
+    """
+    Close the shared browser and stop the Playwright driver.
+
+    Args:
+        only_if_idle: Do nothing while any context is still live, so one
+                      caller finishing never closes another caller's pages.
+    """
+    global _playwright, _browser
+    _bind_loop()
+    async with _lock:
+        if only_if_idle and _live_contexts:
+            return
+        if _browser is not None:
+            await _browser.close()
+            _browser = None
+            logger.info("Shared browser closed")
+        if _playwright is not None:
+            await _playwright.stop()
+            _playwright = None
@@ -0,0 +1,59 @@
+"""
+Login Debug Dumps
+=================
+
+Shared by the Twitter automations: when login stalls, save the error
+screenshot, the browser console log and (optionally) the page HTML side by
+side, with the file writes off the event loop.
+"""
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Awaitable, Iterable, Optional
+
+from playwright.async_api import Page
+
+logger = logging.getLogger('allisson')
+
+
+async def dump_debug_files(
+    page: Page,
+    screenshots_dir: Path,
+    console_messages: Optional[Iterable[str]],
+    screenshot: Awaitable,
+    include_html: bool = True,
+):
+    """
+    Save debugging info for a failed Twitter login concurrently.
+
+    Args:
+        page: Page to dump the HTML of
+        screenshots_dir: Directory for the console log and HTML files
+        console_messages: Collected console lines (may be None)
+        screenshot: The caller's own save_screenshot(...) coroutine
+        include_html: Also save the full DOM (can be large)
+    """
+    html_path = screenshots_dir / 'twitter_error_page.html'
+    log_path = screenshots_dir / 'twitter_error_console.log'
+    log_bytes = '\n'.join(console_messages or []).encode('utf-8')
+
+    async def save_html():
+        page_html = await page.content()
+        await asyncio.to_thread(html_path.write_bytes, page_html.encode('utf-8'))
+
+    jobs = [screenshot, asyncio.to_thread(log_path.write_bytes, log_bytes)]
+    if include_html:
+        jobs.append(save_html())
+    shot, log, *html = await asyncio.gather(*jobs, return_exceptions=True)
+
+    if isinstance(shot, Exception):
+        logger.warning(f"Failed to save error screenshot: {shot}")
+    if isinstance(log, Exception):
+        logger.warning(f"Failed to save console log: {log}")
+    else:
+        logger.info(f"Saved console log: {log_path}")
+    if html and isinstance(html[0], Exception):
+        logger.warning(f"Failed to save page HTML: {html[0]}")
+    elif html:
+        logger.info(f"Saved page HTML: {html_path}")
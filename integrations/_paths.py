@@ -0,0 +1,41 @@
+"""
+Local Paths
+===========
+
+Shared by the browser automations: where the system Chrome lives and where
+sessions and screenshots are stored. Both are looked up once per process, on
+first use, so importing an integration never touches the filesystem.
+"""
+
+import os
+import shutil
+import functools
+from pathlib import Path
+from typing import Optional, Tuple
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_chrome(explicit: Optional[str] = None) -> Optional[str]:
+    """First existing Google Chrome binary (explicit path, CHROME_PATH, common locations), cached."""
+    # Prioritize Google Chrome only; exclude plain Chromium
+    candidates = [explicit, os.getenv('CHROME_PATH'), '/usr/bin/google-chrome-stable', '/usr/bin/google-chrome', '/opt/google/chrome/google-chrome']
+    for c in [p for p in candidates if p]:
+        try:
+            # shutil.which works for names in PATH; os.path.exists checks full paths
+            if shutil.which(c) or os.path.exists(c):
+                return c
+        except Exception:
+            continue
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def media_dirs() -> Tuple[Path, Path]:
+    """(sessions_dir, screenshots_dir), created on first use and shared by all instances."""
+    sessions_dir = BASE_DIR / 'media' / 'sessions'
+    screenshots_dir = BASE_DIR / 'media' / 'screenshots'
+    sessions_dir.mkdir(parents=True, exist_ok=True)
+    screenshots_dir.mkdir(parents=True, exist_ok=True)
+    return sessions_dir, screenshots_dir
@@ -19,13 +19,69 @@ Features:
 
 import asyncio
 import os
+import json
+import random
+import time
 import logging
-from typing import Dict, Any, Optional
-from playwright.async_api import async_playwright, Browser, Page, TimeoutError as PlaywrightTimeout
+from typing import Dict, Any, Optional, Tuple
+from playwright.async_api import Browser, Page, TimeoutError as PlaywrightTimeout
 from pathlib import Path
+from integrations._browser_pool import get_browser, get_playwright, acquire_context, release_context, shutdown_pool
+from integrations._debug_dump import dump_debug_files
+from integrations._paths import BASE_DIR, media_dirs, resolve_chrome
 
 logger = logging.getLogger('allisson')
 
+# Chromium flags: hide automation and drop features a post-only flow never uses
+_LAUNCH_ARGS = [
+    '--disable-blink-features=AutomationControlled',  # Hide automation
+    '--disable-gpu',
+    '--disable-dev-shm-usage',
+    '--disable-extensions',
+    '--no-sandbox',
+    '--disable-background-networking',
+    '--disable-features=TranslateUI,BlinkGenPropertyTrees',
+]
+
+# Appends the remaining tweets of a thread to the compose modal in a single
+# evaluate call. insertText goes through the editor's input handlers, so React
+# sees the text. The first tweet is filled through the normal UI path.
+_THREAD_JS = """
+async (tweets) => {
+    const waitFor = async (selector) => {
+        for (let i = 0; i < 50; i++) {
+            const el = document.querySelector(selector);
+            if (el) return el;
+            await new Promise(r => setTimeout(r, 100));
+        }
+        throw new Error('Timed out waiting for ' + selector);
+    };
+    for (let i = 0; i < tweets.length; i++) {
+        (await waitFor('[data-testid="addButton"]')).click();
+        const box = await waitFor('[data-testid="tweetTextarea_' + (i + 1) + '"]');
+        box.focus();
+        document.execCommand('insertText', false, tweets[i]);
+    }
+}
+"""
+
+
+# Session file path -> (checked_at, exists); session files rarely appear or vanish
+_SESSION_EXISTS_CACHE: Dict[str, Tuple[float, bool]] = {}
+_SESSION_EXISTS_TTL = 30.0
+
+
+def _cached_exists(path: Path) -> bool:
+    """Path.exists() memoised for _SESSION_EXISTS_TTL seconds."""
+    now = time.monotonic()
+    key = str(path)
+    entry = _SESSION_EXISTS_CACHE.get(key)
+    if entry and now - entry[0] < _SESSION_EXISTS_TTL:
+        return entry[1]
+    exists = path.exists()
+    _SESSION_EXISTS_CACHE[key] = (now, exists)
+    return exists
+
 
 class SocialMediaAutomation:
     """
@@ -33,44 +89,46 @@ class SocialMediaAutomation:
     Uses Playwright to control browsers like a human would.
     """
     
+    # Image paths already confirmed to exist, shared by all instances
+    _image_cache: Dict[str, bool] = {}
+    
     def __init__(self):
         self.browser: Optional[Browser] = None
         self.context = None
         self.page: Optional[Page] = None
+        self._screenshot_tasks = []
+        self.debug: bool = os.environ.get('HANNAH_DEBUG') == '1'
         
-        # Create directories for storing sessions and screenshots
-        self.base_dir = Path(__file__).resolve().parent.parent
-        self.sessions_dir = self.base_dir / 'media' / 'sessions'
-        self.screenshots_dir = self.base_dir / 'media' / 'screenshots'
-        
-        self.sessions_dir.mkdir(parents=True, exist_ok=True)
-        self.screenshots_dir.mkdir(parents=True, exist_ok=True)
+        # Directories for storing sessions and screenshots
+        self.base_dir = BASE_DIR
+        self.sessions_dir, self.screenshots_dir = media_dirs()
+        self.session_file: Optional[Path] = None  # Set by each platform
+        self._session_blob: Optional[dict] = None  # Last storage_state seen/written
+        self._logged_in = False
+        self._blocking_resources = False
+    
+    async def _launch(self, playwright, headless: bool) -> Browser:
+        """Launch bundled Chromium for the shared browser pool."""
+        return await playwright.chromium.launch(headless=headless, args=_LAUNCH_ARGS)
     
-    async def start_browser(self, headless: bool = True):
+    async def start_browser(self, headless: bool = True, browser: Optional[Browser] = None):
         """
         Start browser with anti-detection settings.
         
         Args:
             headless: Run browser in background (True) or visible (False)
+            browser: Existing browser to open a context in (defaults to the shared pool)
         """
-        playwright = await async_playwright().start()
-        
-        # Launch browser with realistic settings
-        self.browser = await playwright.chromium.launch(
-            headless=headless,
-            args=[
-                '--disable-blink-features=AutomationControlled',  # Hide automation
-                '--disable-dev-shm-usage',
-                '--no-sandbox',
-            ]
-        )
+        self.browser = browser or await get_browser(lambda playwright: self._launch(playwright, headless))
         
-        # Create context with realistic fingerprint
-        self.context = await self.browser.new_context(
+        # Create context with realistic fingerprint and any saved session
+        self.context = await acquire_context(
+            self.browser,
             viewport={'width': 1920, 'height': 1080},
             user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             locale='en-US',
             timezone_id='America/New_York',
+            storage_state=self._saved_state(),
         )
         
         # Remove webdriver property
@@ -80,18 +138,98 @@ class SocialMediaAutomation:
             });
         """)
         
+        # Posting never needs feed images or fonts
+        self._blocking_resources = False
+        await self._block_heavy_resources()
+        
         self.page = await self.context.new_page()
+        self._attach_locators()
         logger.info("Browser started successfully")
     
+    def _attach_locators(self):
+        """Build the platform's reusable page locators; called once per new page."""
+    
     async def close_browser(self):
-        """Close browser and cleanup."""
-        if self.browser:
-            await self.browser.close()
-            logger.info("Browser closed")
+        """Release this instance's context; the shared browser stays up for reuse."""
+        await self._flush_screenshots()
+        if self.context:
+            await release_context(self.context)
+            self.context = None
+            self.page = None
+            self._logged_in = False
+            logger.info("Browser context closed")
+    
+    async def _abort_heavy_resources(self, route):
+        request = route.request
+        if request.resource_type in {'image', 'font', 'media'}:
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    async def _block_heavy_resources(self):
+        """Stop loading images, fonts and media in this context."""
+        if not self._blocking_resources:
+            await self.context.route('**/*', self._abort_heavy_resources)
+            self._blocking_resources = True
+    
+    async def _unblock_heavy_resources(self):
+        """Restore normal resource loading so the compose UI renders fully."""
+        if self._blocking_resources:
+            await self.context.unroute('**/*', self._abort_heavy_resources)
+            self._blocking_resources = False
+    
+    async def is_logged_in(self) -> bool:
+        """Cheap check for a live session, so callers can skip login()."""
+        return self._logged_in
+    
+    def _saved_state(self):
+        """Session to preload into a new context: in-memory copy first, then the file."""
+        if self._session_blob is not None:
+            return self._session_blob
+        if self.session_file and _cached_exists(self.session_file):
+            return str(self.session_file)
+        return None
+    
+    async def save_session(self):
+        """Persist the context's cookies and local storage, writing only on change."""
+        try:
+            state = await self.context.storage_state()
+            if state != self._session_blob:
+                with open(self.session_file, 'w', encoding='utf-8') as f:
+                    json.dump(state, f)
+                self._session_blob = state
+                _SESSION_EXISTS_CACHE.pop(str(self.session_file), None)
+        except Exception as e:
+            logger.warning(f"Failed to save session: {e}")
+    
+    def _image_exists(self, image_path: str) -> bool:
+        """os.path.exists() that remembers hits, so reposting an image skips the stat."""
+        if image_path in self._image_cache:
+            return True
+        exists = os.path.exists(image_path)
+        if exists:
+            self._image_cache[image_path] = True
+        return exists
+    
+    async def wait_for_confirmation(self, selector: str, timeout: float = 6000) -> bool:
+        """Wait until `selector` appears; False (not an error) if it never does."""
+        try:
+            await self.page.wait_for_selector(selector, timeout=timeout)
+            return True
+        except PlaywrightTimeout:
+            logger.warning(f"No confirmation seen for: {selector}")
+            return False
+    
+    def _ok(self, **fields) -> Dict[str, Any]:
+        """Build a success result for this platform."""
+        return {'success': True, 'platform': self.platform, 'timestamp': time.monotonic(), **fields}
+    
+    def _err(self, error, **fields) -> Dict[str, Any]:
+        """Build a failure result for this platform."""
+        return {'success': False, 'platform': self.platform, 'error': str(error), **fields}
     
     async def human_delay(self, min_seconds: float = 3.0, max_seconds: float = 6.0):
         """Add human-like random delay to avoid detection."""
-        import random
         delay = random.uniform(min_seconds, max_seconds)
         await asyncio.sleep(delay)
     
@@ -103,6 +241,21 @@ class SocialMediaAutomation:
             logger.info(f"Screenshot saved: {screenshot_path}")
             return str(screenshot_path)
         return None
+    
+    def save_screenshot_async(self, filename: str):
+        """Capture a debug screenshot in the background (only when debug is on)."""
+        if self.debug and self.page:
+            screenshot_path = self.screenshots_dir / filename
+            task = asyncio.create_task(self.page.screenshot(path=str(screenshot_path)))
+            self._screenshot_tasks.append(task)
+            return str(screenshot_path)
+        return None
+    
+    async def _flush_screenshots(self):
+        """Wait for pending background screenshots before the page goes away."""
+        if self._screenshot_tasks:
+            await asyncio.gather(*self._screenshot_tasks, return_exceptions=True)
+            self._screenshot_tasks = []
 
 
 class TwitterAutomation(SocialMediaAutomation):
@@ -142,39 +295,14 @@ class TwitterAutomation(SocialMediaAutomation):
         self.console_messages = []
         self.cookies_auth = None  # For fallback to cookie-based auth
     
-    async def start_browser(self, headless: bool = True, use_chrome: bool = True, chrome_path: Optional[str] = None):
-        """
-        Start browser with improved anti-detection settings.
+    async def _launch(self, playwright, headless: bool, use_chrome: bool = True, chrome_path: Optional[str] = None) -> Browser:
+        """Launch system Chrome for the shared browser pool."""
+        # Determine executable path for system Chrome if requested
+        exec_path = resolve_chrome(chrome_path) if use_chrome else None
         
-        Args:
-            headless: Run in background (True) or visible (False)
-            use_chrome: Prefer system Chrome over bundled Chromium
-            chrome_path: Optional explicit path to Chrome binary
-        """
-        playwright = await async_playwright().start()
+        launch_kwargs = dict(headless=headless, args=_LAUNCH_ARGS)
         
-        # Determine executable path for system Chrome if requested
-        exec_path = None
-        if use_chrome:
-            import shutil
-            env_path = os.getenv('CHROME_PATH')
-            candidates = [chrome_path, env_path, '/usr/bin/google-chrome-stable', '/usr/bin/google-chrome', '/opt/google/chrome/google-chrome']
-            for c in [p for p in candidates if p]:
-                try:
-                    if shutil.which(c) or os.path.exists(c):
-                        exec_path = c
-                        break
-                except Exception:
-                    continue
-        
-        launch_kwargs = dict(
-            headless=headless,
-            args=[
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--no-sandbox',
-            ]
-        )
+        browser = None
         
         # Prefer Playwright channel='chrome' when requesting system Chrome
         if use_chrome:
@@ -183,29 +311,53 @@ class TwitterAutomation(SocialMediaAutomation):
                 ch_kwargs['channel'] = 'chrome'
                 ch_kwargs.pop('executable_path', None)
                 logger.info("[DEBUG] Attempting launch with Playwright channel='chrome'")
-                self.browser = await playwright.chromium.launch(**ch_kwargs)
+                browser = await playwright.chromium.launch(**ch_kwargs)
             except Exception as e_chan:
                 logger.warning(f"[DEBUG] channel='chrome' launch failed: {e_chan}")
                 if exec_path:
                     try:
                         launch_kwargs['executable_path'] = exec_path
                         logger.info(f"[DEBUG] Attempting launch with executable_path: {exec_path}")
-                        self.browser = await playwright.chromium.launch(**launch_kwargs)
+                        browser = await playwright.chromium.launch(**launch_kwargs)
                     except Exception as e_exec:
                         logger.error(f"[DEBUG] executable_path launch failed: {e_exec}")
                         raise RuntimeError("Failed to launch system Chrome. Check Chrome installation or CHROME_PATH environment variable.")
         else:
             raise RuntimeError("Chromium use is disabled. Set use_chrome=True and ensure Chrome is available.")
         
-        if not self.browser:
+        if not browser:
             raise RuntimeError("Failed to launch browser - no system Chrome available")
         
+        return browser
+    
+    async def start_browser(
+        self,
+        headless: bool = True,
+        use_chrome: bool = True,
+        chrome_path: Optional[str] = None,
+        browser: Optional[Browser] = None
+    ):
+        """
+        Start browser with improved anti-detection settings.
+        
+        Args:
+            headless: Run in background (True) or visible (False)
+            use_chrome: Prefer system Chrome over bundled Chromium
+            chrome_path: Optional explicit path to Chrome binary
+            browser: Existing browser to open a context in (defaults to the shared pool)
+        """
+        self.browser = browser or await get_browser(
+            lambda playwright: self._launch(playwright, headless, use_chrome, chrome_path)
+        )
+        
         # Create context with realistic fingerprint and ALL necessary permissions/features
-        self.context = await self.browser.new_context(
+        self.context = await acquire_context(
+            self.browser,
             viewport={'width': 1920, 'height': 1080},
             user_agent='Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             locale='en-US',
             timezone_id='America/New_York',
+            storage_state=self._saved_state(),
             permissions=['notifications'],
             extra_http_headers={
                 'Accept-Language': 'en-US,en;q=0.9',
@@ -246,8 +398,10 @@ class TwitterAutomation(SocialMediaAutomation):
         """
         
         await self.context.add_init_script(stealth_script)
+        self._blocking_resources = False
         
         self.page = await self.context.new_page()
+        self._attach_locators()
         
         # Set reasonable timeouts
         self.page.set_default_timeout(30000)
@@ -264,6 +418,31 @@ class TwitterAutomation(SocialMediaAutomation):
         
         logger.info("Browser started successfully with advanced stealth and anti-detection settings")
     
+    def _attach_locators(self):
+        self.loc_compose_btn = self.page.locator('[data-testid="SideNav_NewTweet_Button"]')
+        self.loc_tweet_textarea = self.page.locator('[data-testid="tweetTextarea_0"]')
+        self.loc_add_tweet = self.page.locator('[data-testid="addButton"]')
+        self.loc_post_btn = self.page.locator('[data-testid="tweetButtonInline"]')
+        # Inline composer and modal use different test ids; matches whichever renders
+        self.loc_any_post_btn = self.page.locator('[data-testid="tweetButtonInline"], [data-testid="tweetButton"]').first
+    
+    async def is_logged_in(self) -> bool:
+        """True if logged in already, or the page is on home with the composer visible."""
+        if self._logged_in:
+            return True
+        if not self.page or 'home' not in self.page.url:
+            return False
+        return await self.loc_compose_btn.count() > 0
+    
+    async def _dump_debug_files(self):
+        """Save the error screenshot, console log and (in debug mode) page HTML."""
+        await dump_debug_files(
+            self.page, self.screenshots_dir, self.console_messages,
+            self.save_screenshot('twitter_error_no_password_field.png'),
+            include_html=self.debug,  # Full DOM dump only in debug mode
+        )
+    
+    
     async def login(self, username: str, password: str, email: Optional[str] = None) -> bool:
         """
         Login to Twitter/X with UPDATED selectors and better error handling.
@@ -279,27 +458,45 @@ class TwitterAutomation(SocialMediaAutomation):
         try:
             logger.info("Starting Twitter login...")
             
-            # Try to use saved session first
-            if self.session_file.exists():
-                logger.info("Loading saved session...")
+            # Saved session cookies were loaded into the context by start_browser
+            if _cached_exists(self.session_file):
+                logger.info("Verifying saved session...")
                 try:
-                    await self.context.storage_state(path=str(self.session_file))
                     await self.page.goto('https://twitter.com/home', wait_until='networkidle', timeout=30000)
                     
-                    await asyncio.sleep(4)
-                    if 'home' in self.page.url or 'twitter.com' in self.page.url:
-                        try:
-                            await self.page.wait_for_selector('[data-testid="SideNav_NewTweet_Button"]', timeout=5000)
-                            logger.info("✅ Logged in using saved session")
-                            return True
-                        except:
-                            logger.info("Session expired, will login fresh")
+                    # One bounded wait until the composer renders or we land on login/logout;
+                    # resolves with both facts so no second round-trip is needed
+                    try:
+                        handle = await self.page.wait_for_function(
+                            "() => { const hasCompose = !!document.querySelector("
+                            "'[data-testid=\"SideNav_NewTweet_Button\"]'); const url = location.href; "
+                            "return (hasCompose || /\\/log(in|out)/.test(url)) && {url, hasCompose}; }",
+                            timeout=5000,
+                        )
+                        state = await handle.json_value()
+                    except PlaywrightTimeout:
+                        state = {'url': self.page.url, 'hasCompose': False}
+                    if '/login' in state['url'] or '/logout' in state['url']:
+                        # Redirected to login: the stored cookies are no longer valid
+                        logger.info("Saved session rejected, discarding it")
+                        self.session_file.unlink(missing_ok=True)
+                        _SESSION_EXISTS_CACHE.pop(str(self.session_file), None)
+                        self._session_blob = None
+                    elif state['hasCompose']:
+                        logger.info("✅ Logged in using saved session")
+                        self._logged_in = True
+                        return True
+                    else:
+                        logger.info("Session not confirmed, will login fresh")
                 except Exception as e:
                     logger.info(f"Session load failed: {e}, will login fresh")
             
             # Fresh login required
             logger.info("Starting fresh login...")
             
+            # The login form doesn't need images/fonts/media; skip them until posting
+            await self._block_heavy_resources()
+            
             try:
                 await self.page.goto('https://twitter.com/i/flow/login', wait_until='networkidle', timeout=45000)
             except Exception as e:
@@ -319,33 +516,8 @@ class TwitterAutomation(SocialMediaAutomation):
             # Step 1: Enter username
             logger.info("Step 1: Entering username...")
             try:
-                username_input = await self.page.wait_for_selector('input[autocomplete="username"]', timeout=20000)
-                await username_input.click()
-                await self.human_delay(6, 8)
-                await username_input.type(username, delay=50)  # Type with 50ms delay between keys
-                await self.human_delay(6, 8)
-                await self.save_screenshot('twitter_username_entered.png')
-                
-                # Look for Next button
-                logger.info("Looking for Next button...")
-                next_button = None
-                buttons = await self.page.query_selector_all('button')
-                for btn in buttons:
-                    try:
-                        aria_label = await btn.get_attribute('aria-label')
-                        if aria_label and 'next' in aria_label.lower():
-                            logger.info(f"Found Next button with aria-label: {aria_label}")
-                            next_button = btn
-                            break
-                    except:
-                        pass
-                
-                if next_button:
-                    await next_button.click()
-                    logger.info("Clicked Next button")
-                else:
-                    logger.info("No Next button found, pressing Enter...")
-                    await self.page.keyboard.press('Enter')
+                await self.page.locator('input[autocomplete="username"]').fill(username, timeout=20000)
+                await self.page.keyboard.press('Enter')
                 
                 logger.info("Waiting for page to transition after username entry...")
                 await self.human_delay(6, 8)
@@ -420,15 +592,17 @@ class TwitterAutomation(SocialMediaAutomation):
                     
                     # Check what's actually on the page
                     try:
-                        page_content = await self.page.content()
-                        if 'JavaScript is not available' in page_content or 'javascript' in page_content.lower():
+                        has_noscript = await self.page.evaluate(
+                            "() => !!document.body && document.body.innerText.includes('JavaScript is not available')"
+                        )
+                        if has_noscript:
                             logger.error("ERROR: Twitter is showing 'JavaScript not available' message!")
                             logger.error("This means Twitter's React components didn't load.")
                             logger.error("Possible causes:")
                             logger.error("  1. JavaScript execution is blocked")
                             logger.error("  2. Browser context lacks required permissions")
                             logger.error("  3. API endpoints are failing (check console errors)")
-                    except:
+                    except Exception:
                         pass
                     
                     # Try clicking any "Next" button
@@ -444,9 +618,9 @@ class TwitterAutomation(SocialMediaAutomation):
                                     await btn.click()
                                     await self.human_delay(4, 7)
                                     break
-                            except:
+                            except Exception:
                                 pass
-                    except:
+                    except Exception:
                         pass
                     
                     # Retry password field with longer wait
@@ -462,33 +636,10 @@ class TwitterAutomation(SocialMediaAutomation):
                 
                 if not password_input:
                     logger.error("Password input not found after retries")
-                    await self.save_screenshot('twitter_error_no_password_field.png')
-                    
-                    # Save debugging info
-                    try:
-                        page_html = await self.page.content()
-                        html_path = self.screenshots_dir / 'twitter_error_page.html'
-                        html_path.write_text(page_html, encoding='utf-8')
-                        logger.info(f"Saved page HTML: {html_path}")
-                    except Exception as e:
-                        logger.warning(f"Failed to save page HTML: {e}")
-                    
-                    try:
-                        log_path = self.screenshots_dir / 'twitter_error_console.log'
-                        with open(log_path, 'w', encoding='utf-8') as f:
-                            f.write('\n'.join(self.console_messages or []))
-                        logger.info(f"Saved console log: {log_path}")
-                    except Exception as e:
-                        logger.warning(f"Failed to save console log: {e}")
-                    
+                    await self._dump_debug_files()
                     return False
                 
-                await password_input.click()
-                await self.human_delay(5, 7)
                 await password_input.fill(password)
-                await self.human_delay(6, 8)
-                await self.save_screenshot('twitter_password_entered.png')
-                
                 await self.page.keyboard.press('Enter')
                 
             except PlaywrightTimeout:
@@ -504,8 +655,9 @@ class TwitterAutomation(SocialMediaAutomation):
                 await self.save_screenshot('twitter_logged_in.png')
                 
                 if 'home' in self.page.url:
-                    await self.context.storage_state(path=str(self.session_file))
+                    await self.save_session()
                     logger.info("✅ Twitter login successful - Session saved")
+                    self._logged_in = True
                     return True
                 else:
                     logger.error("Login completed but not on home page")
@@ -535,126 +687,101 @@ class TwitterAutomation(SocialMediaAutomation):
         """
         try:
             logger.info(f"Posting tweet: {content[:50]}...")
+            await self._unblock_heavy_resources()
             
             # Make sure we're on home page
             if 'home' not in self.page.url:
                 logger.info("Navigating to home page...")
-                await self.page.goto('https://twitter.com/home', wait_until='networkidle', timeout=30000)
-                await self.human_delay(4, 6)
+                # Only the composer matters; its selector wait below is the readiness gate
+                await self.page.goto('https://twitter.com/home', wait_until='domcontentloaded', timeout=30000)
             
-            await self.save_screenshot('twitter_before_compose.png')
+            self.save_screenshot_async('twitter_before_compose.png')
             
             # Method 1: Try clicking the compose button in sidebar
             try:
                 logger.info("Method 1: Looking for compose button...")
-                compose_button = await self.page.wait_for_selector('[data-testid="SideNav_NewTweet_Button"]', timeout=10000)
-                await compose_button.click()
+                await self.loc_compose_btn.click(timeout=10000)
                 await self.human_delay(4, 6)
-                await self.save_screenshot('twitter_compose_clicked.png')
-            except:
+                self.save_screenshot_async('twitter_compose_clicked.png')
+            except PlaywrightTimeout:
                 logger.info("Method 1 failed, trying Method 2...")
                 
                 # Method 2: Try clicking in the "What's happening" box
                 try:
-                    tweet_box = await self.page.wait_for_selector('[data-testid="tweetTextarea_0"]', timeout=10000)
-                    await tweet_box.click()
+                    await self.loc_tweet_textarea.click(timeout=10000)
                     await self.human_delay(1, 2)
-                except:
+                except PlaywrightTimeout:
                     logger.error("Could not find tweet compose area")
                     await self.save_screenshot('twitter_error_no_compose.png')
-                    return {
-                        'success': False,
-                        'platform': 'twitter',
-                        'error': 'Could not find tweet compose area'
-                    }
+                    return self._err('Could not find tweet compose area')
             
             # Type the tweet content
             logger.info("Typing tweet content...")
-            tweet_input = await self.page.wait_for_selector('[data-testid="tweetTextarea_0"]', timeout=15000)
-            await tweet_input.fill(content)
+            await self.loc_tweet_textarea.fill(content, timeout=15000)
             await self.human_delay(2, 3)
-            await self.save_screenshot('twitter_content_entered.png')
+            self.save_screenshot_async('twitter_content_entered.png')
             
             # Upload image if provided
-            if image_path and os.path.exists(image_path):
+            if image_path and self._image_exists(image_path):
                 logger.info(f"Uploading image: {image_path}")
                 try:
                     file_input = await self.page.query_selector('input[type="file"][accept*="image"]')
                     if file_input:
                         await file_input.set_input_files(image_path)
                         await self.human_delay(3, 4)
-                        await self.save_screenshot('twitter_image_uploaded.png')
+                        self.save_screenshot_async('twitter_image_uploaded.png')
                 except Exception as e:
                     logger.warning(f"Image upload failed: {e}")
             
             # Click the Post button
             logger.info("Clicking Post button...")
             try:
-                post_button = None
-                
                 try:
-                    post_button = await self.page.wait_for_selector('[data-testid="tweetButtonInline"]', timeout=5000)
-                except:
-                    pass
-                
-                if not post_button:
-                    try:
-                        post_button = await self.page.wait_for_selector('[data-testid="tweetButton"]', timeout=5000)
-                    except:
-                        pass
-                
-                if not post_button:
+                    await self.loc_any_post_btn.click(timeout=8000)
+                except PlaywrightTimeout:
                     logger.error("Could not find Post button")
                     await self.save_screenshot('twitter_error_no_post_button.png')
-                    return {
-                        'success': False,
-                        'platform': 'twitter',
-                        'error': 'Could not find Post button'
-                    }
+                    return self._err('Could not find Post button')
                 
-                await post_button.click()
                 logger.info("Post button clicked!")
                 
             except Exception as e:
                 logger.error(f"Error clicking post button: {e}")
                 await self.save_screenshot('twitter_error_post_click.png')
-                return {
-                    'success': False,
-                    'platform': 'twitter',
-                    'error': f'Error clicking post: {str(e)}'
-                }
+                return self._err(f'Error clicking post: {str(e)}')
             
             # Wait for post to complete
-            await self.human_delay(4, 6)
-            await self.save_screenshot('twitter_post_success.png')
+            confirmed = await self.wait_for_confirmation('[data-testid="toast"]')
+            self.save_screenshot_async('twitter_post_success.png')
             
             # Try to get tweet URL
             tweet_url = "Posted successfully"
-            try:
-                current_url = self.page.url
-                if '/status/' in current_url:
-                    tweet_url = current_url
-            except:
-                pass
+            current_url = getattr(self.page, 'url', '') or ''
+            if '/status/' in current_url:
+                tweet_url = current_url
             
             logger.info(f"✅ Tweet posted successfully: {tweet_url}")
+            await self.save_session()
+            self._logged_in = True
             
-            return {
-                'success': True,
-                'platform': 'twitter',
-                'content': content,
-                'url': tweet_url,
-                'timestamp': asyncio.get_event_loop().time()
-            }
+            return self._ok(content=content, url=tweet_url, confirmed=confirmed)
             
         except Exception as e:
             logger.error(f"Failed to post tweet: {str(e)}")
             await self.save_screenshot('twitter_post_error.png')
-            return {
-                'success': False,
-                'platform': 'twitter',
-                'error': str(e)
-            }
+            return self._err(e)
+    
+    async def _fill_thread_ui(self, tweets: list[str]):
+        """Fill thread tweets through the compose UI."""
+        add_btn_loc = self.loc_add_tweet
+        textarea_locs = [self.page.locator(f'[data-testid="tweetTextarea_{i}"]') for i in range(len(tweets))]
+        
+        # fill() types into whichever box has focus, so the boxes are filled strictly
+        # one at a time; each "Add another tweet" click reveals the next box
+        for i, (textarea_loc, text) in enumerate(zip(textarea_locs, tweets)):
+            if i and not await textarea_loc.count():
+                await add_btn_loc.click()
+            await textarea_loc.fill(text)
     
     async def post_thread(self, tweets: list[str]) -> Dict[str, Any]:
         """
@@ -668,67 +795,49 @@ class TwitterAutomation(SocialMediaAutomation):
         """
         try:
             logger.info(f"Posting thread with {len(tweets)} tweets...")
+            await self._unblock_heavy_resources()
             
             # Navigate to home
-            await self.page.goto('https://twitter.com/home')
-            await self.human_delay(2, 3)
+            await self.page.goto('https://twitter.com/home', wait_until='domcontentloaded')
             
             # Click compose
-            tweet_button = await self.page.wait_for_selector('[data-testid="tweetTextarea_0"]')
-            await tweet_button.click()
-            await self.human_delay(3, 4)
+            tweet_box = self.loc_tweet_textarea
+            await tweet_box.click()
             
-            # Post first tweet to start thread
-            await tweet_button.fill(tweets[0])
-            await self.human_delay(4, 6)
-            
-            # Add remaining tweets to thread
-            for i, tweet_text in enumerate(tweets[1:], 1):
-                # Click "Add another tweet" button
-                add_tweet_btn = await self.page.wait_for_selector('[data-testid="addButton"]')
-                await add_tweet_btn.click()
-                await self.human_delay(0.5, 1)
-                
-                # Fill next tweet
-                next_textarea = await self.page.wait_for_selector(f'[data-testid="tweetTextarea_{i}"]')
-                await next_textarea.fill(tweet_text)
-                await self.human_delay(1, 1.5)
+            # First tweet through the UI, the rest in one script; drive the UI
+            # per tweet only if the script fails
+            try:
+                await tweet_box.fill(tweets[0])
+                if len(tweets) > 1:
+                    await self.page.evaluate(_THREAD_JS, tweets[1:])
+            except Exception as e:
+                logger.info(f"Batched thread fill failed ({e}), filling tweets one by one...")
+                await self._fill_thread_ui(tweets)
             
             # Post the thread
-            post_button = await self.page.wait_for_selector('[data-testid="tweetButtonInline"]')
-            await post_button.click()
+            await self.loc_post_btn.click()
             
-            await self.human_delay(3, 4)
+            # Twitter shows a "Your post was sent" toast once the thread is live
+            confirmed = await self.wait_for_confirmation('[data-testid="toast"]')
             
             # Get thread URL
             thread_url = "Thread posted successfully"
-            try:
-                current_url = self.page.url
-                if '/status/' in current_url:
-                    thread_url = current_url
-            except:
-                pass
+            current_url = getattr(self.page, 'url', '') or ''
+            if '/status/' in current_url:
+                thread_url = current_url
             
-            await self.save_screenshot('twitter_thread_success.png')
+            if self.debug:
+                await self.save_screenshot('twitter_thread_success.png')
             logger.info(f"✅ Thread posted successfully: {thread_url}")
+            await self.save_session()
+            self._logged_in = True
             
-            return {
-                'success': True,
-                'platform': 'twitter',
-                'type': 'thread',
-                'tweets': tweets,
-                'url': thread_url,
-                'timestamp': asyncio.get_event_loop().time()
-            }
+            return self._ok(type='thread', tweets=tweets, url=thread_url, confirmed=confirmed)
             
         except Exception as e:
             logger.error(f"Failed to post thread: {str(e)}")
             await self.save_screenshot('twitter_thread_error.png')
-            return {
-                'success': False,
-                'platform': 'twitter',
-                'error': str(e)
-            }
+            return self._err(e)
 
 
 class LinkedInAutomation(SocialMediaAutomation):
@@ -746,6 +855,17 @@ class LinkedInAutomation(SocialMediaAutomation):
         self.platform = "linkedin"
         self.session_file = self.sessions_dir / f'{self.platform}_session.json'
     
+    def _attach_locators(self):
+        self.loc_share_box = self.page.locator('[data-test-id="share-box-open"]')
+        self.loc_editor = self.page.locator('.ql-editor')
+        self.loc_post_btn = self.page.locator('[data-test-id="share-actions__primary-action"]')
+    
+    async def is_logged_in(self) -> bool:
+        """True if logged in already, or on the feed with a saved session."""
+        if self._logged_in:
+            return True
+        return bool(self.page) and 'feed' in self.page.url and _cached_exists(self.session_file)
+    
     async def login(self, email: str, password: str) -> bool:
         """
         Login to LinkedIn and save session.
@@ -761,15 +881,19 @@ class LinkedInAutomation(SocialMediaAutomation):
             logger.info("Starting LinkedIn login...")
             
             # Check if we have a saved session
-            if self.session_file.exists():
-                logger.info("Loading saved session...")
-                await self.context.storage_state(path=str(self.session_file))
-                await self.page.goto('https://www.linkedin.com/feed/')
+            # Saved session cookies were loaded into the context by start_browser
+            if _cached_exists(self.session_file):
+                logger.info("Verifying saved session...")
+                await self.page.goto('https://www.linkedin.com/feed/', wait_until='domcontentloaded')
                 
-                # Verify we're logged in
-                await self.page.wait_for_timeout(3000)
+                # Verify we're logged in (LinkedIn redirects to login if not)
+                try:
+                    await self.page.wait_for_url('**/feed/**', timeout=5000)
+                except PlaywrightTimeout:
+                    pass
                 if 'feed' in self.page.url:
                     logger.info("✅ Logged in using saved session")
+                    self._logged_in = True
                     return True
             
             # Fresh login required
@@ -777,26 +901,24 @@ class LinkedInAutomation(SocialMediaAutomation):
             await self.human_delay(4, 5)
             
             # Enter email / username
-            email_input = await self.page.wait_for_selector('#username')
-            await email_input.fill(email)
+            await self.page.locator('#username').fill(email)
             await self.human_delay(0.5, 1)
             
             # Enter password
-            password_input = await self.page.wait_for_selector('#password')
-            await password_input.fill(password)
+            await self.page.locator('#password').fill(password)
             await self.human_delay(3, 5)
             
             # Click login
-            login_button = await self.page.wait_for_selector('button[type="submit"]')
-            await login_button.click()
+            await self.page.locator('button[type="submit"]').click(timeout=15000)
             
             # Wait for login to complete
             await self.page.wait_for_url('**/feed/', timeout=15000)
             await self.human_delay(2, 3)
             
             # Save session
-            await self.context.storage_state(path=str(self.session_file))
+            await self.save_session()
             logger.info("✅ LinkedIn login successful - Session saved")
+            self._logged_in = True
             
             return True
             
@@ -820,60 +942,46 @@ class LinkedInAutomation(SocialMediaAutomation):
             logger.info(f"Posting LinkedIn update: {content[:50]}...")
             
             # Navigate to feed if not already there
+            start_post = self.loc_share_box
             if 'feed' not in self.page.url:
-                await self.page.goto('https://www.linkedin.com/feed/')
-                await self.human_delay(2, 3)
+                await self.page.goto('https://www.linkedin.com/feed/', wait_until='domcontentloaded')
             
-            # Click "Start a post" button
-            start_post = await self.page.wait_for_selector('[data-test-id="share-box-open"]')
+            # Click "Start a post" button once it renders, rather than waiting for the whole feed;
+            # click() auto-waits for it to be actionable
             await start_post.click()
-            await self.human_delay(1, 2)
             
             # Type content
-            text_editor = await self.page.wait_for_selector('.ql-editor')
-            await text_editor.fill(content)
-            await self.human_delay(1, 2)
+            await self.loc_editor.fill(content)
             
             # Upload image if provided
-            if image_path and os.path.exists(image_path):
+            if image_path and self._image_exists(image_path):
                 logger.info(f"Uploading image: {image_path}")
-                # Click media upload button
-                media_button = await self.page.wait_for_selector('[aria-label*="Add"]')
-                await media_button.click()
-                await self.human_delay(0.5, 1)
-                
-                # Upload file
-                file_input = await self.page.query_selector('input[type="file"]')
-                if file_input:
-                    await file_input.set_input_files(image_path)
-                    await self.human_delay(3, 4)  # Wait for upload
+                # The composer's hidden file input is always in the DOM; no need to open the picker
+                await self.page.locator('input[type="file"]').first.set_input_files(image_path)
+                try:
+                    await self.page.locator('img[src^="blob:"], [aria-label*="Remove media"]').first.wait_for(
+                        state='visible', timeout=15000
+                    )
+                except PlaywrightTimeout:
+                    logger.warning("Image preview did not appear")
             
             # Click Post button
-            post_button = await self.page.wait_for_selector('[data-test-id="share-actions__primary-action"]')
-            await post_button.click()
+            await self.loc_post_btn.click()
             
             # Wait for post to complete
-            await self.human_delay(3, 4)
+            confirmed = await self.wait_for_confirmation('[data-test-id="share-success-toast"], div[role="alert"]')
             
-            await self.save_screenshot('linkedin_post_success.png')
+            if self.debug:
+                await self.save_screenshot('linkedin_post_success.png')
             logger.info("✅ LinkedIn post successful")
+            self._logged_in = True
             
-            return {
-                'success': True,
-                'platform': 'linkedin',
-                'content': content,
-                'url': 'Posted successfully',
-                'timestamp': asyncio.get_event_loop().time()
-            }
+            return self._ok(content=content, url='Posted successfully', confirmed=confirmed)
             
         except Exception as e:
             logger.error(f"Failed to post LinkedIn update: {str(e)}")
             await self.save_screenshot('linkedin_post_error.png')
-            return {
-                'success': False,
-                'platform': 'linkedin',
-                'error': str(e)
-            }
+            return self._err(e)
 
 
 class SocialMediaManager:
@@ -886,20 +994,54 @@ class SocialMediaManager:
         self.twitter = TwitterAutomation()
         self.linkedin = LinkedInAutomation()
         self._initialized = False
+        self._own_browser: Optional[Browser] = None  # LinkedIn's private Chromium when Chrome is missing
+        # Serialises initialize()/cleanup() so concurrent posts start the contexts once
+        self._init_lock = asyncio.Lock()
+        
+        # Caps concurrent post_to_platform() flows over the shared browser
+        self._sem = asyncio.Semaphore(int(os.environ.get('HANNAH_CDP_CONCURRENCY', 4)))
+        
+        # platform -> (automation, post coroutine, login credential keys)
+        self._handlers = {
+            'twitter': (self.twitter, self.twitter.post_tweet, ('username', 'password', 'email')),
+            'linkedin': (self.linkedin, self.linkedin.post_update, ('email', 'password')),
+        }
     
     async def initialize(self):
-        """Start browsers for all platforms."""
-        if not self._initialized:
-            await self.twitter.start_browser(headless=True)
-            await self.linkedin.start_browser(headless=True)
+        """Start a context per platform on the shared system-Chrome browser."""
+        async with self._init_lock:
+            if self._initialized:
+                return
+            try:
+                browser = await get_browser(lambda playwright: self.twitter._launch(playwright, headless=True))
+            except Exception as e:
+                # Twitter refuses bundled Chromium; only LinkedIn falls back to it, on a
+                # private browser so the shared one never silently becomes Chromium
+                logger.warning(f"System Chrome unavailable ({e}); Twitter disabled, LinkedIn on bundled Chromium")
+                self._own_browser = await self.linkedin._launch(await get_playwright(), headless=True)
+                await self.linkedin.start_browser(headless=True, browser=self._own_browser)
+            else:
+                # One after the other: the first context is counted by the pool before
+                # anything yields, so another manager's idle shutdown can't close the browser
+                await self.twitter.start_browser(headless=True, browser=browser)
+                await self.linkedin.start_browser(headless=True, browser=browser)
             self._initialized = True
     
     async def cleanup(self):
-        """Close all browsers."""
-        if self._initialized:
-            await self.twitter.close_browser()
-            await self.linkedin.close_browser()
+        """Close each platform's context, and the shared browser once nobody else uses it."""
+        async with self._init_lock:
+            if not self._initialized:
+                return
+            await asyncio.gather(
+                self.twitter.close_browser(),
+                self.linkedin.close_browser(),
+            )
             self._initialized = False
+            if self._own_browser is not None:
+                await self._own_browser.close()
+                self._own_browser = None
+            # Don't leave Chrome and the driver running (on a loop that may end) once idle
+            await shutdown_pool(only_if_idle=True)
     
     async def post_to_platform(
         self,
@@ -920,37 +1062,29 @@ class SocialMediaManager:
         Returns:
             Dict with success status and post details
         """
+        entry = self._handlers.get(platform)
+        if entry is None:
+            return {
+                'success': False,
+                'error': f'Platform {platform} not supported'
+            }
+        automation, post, login_keys = entry
+        
         await self.initialize()
+        if automation.context is None:
+            return {
+                'success': False,
+                'platform': platform,
+                'error': f'{platform} browser unavailable (system Chrome is required)'
+            }
         
         try:
-            if platform == 'twitter':
-                # Login if credentials provided and not already logged in
-                if credentials:
-                    await self.twitter.login(
-                        username=credentials.get('username'),
-                        password=credentials.get('password'),
-                        email=credentials.get('email')
-                    )
+            async with self._sem:
+                # Login only if credentials provided and no live session
+                if credentials and not await automation.is_logged_in():
+                    await automation.login(**{key: credentials.get(key) for key in login_keys})
                 
-                result = await self.twitter.post_tweet(content, image_path)
-                
-            elif platform == 'linkedin':
-                # Login if credentials provided
-                if credentials:
-                    await self.linkedin.login(
-                        email=credentials.get('email'),
-                        password=credentials.get('password')
-                    )
-                
-                result = await self.linkedin.post_update(content, image_path)
-                
-            else:
-                result = {
-                    'success': False,
-                    'error': f'Platform {platform} not supported'
-                }
-            
-            return result
+                return await post(content, image_path)
             
         except Exception as e:
             logger.error(f"Error posting to {platform}: {str(e)}")
@@ -960,6 +1094,41 @@ class SocialMediaManager:
                 'error': str(e)
             }
     
+    async def post_to_all(
+        self,
+        content: str,
+        image_path: Optional[str] = None,
+        creds_map: Optional[Dict[str, Dict[str, str]]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Post the same content to several platforms concurrently.
+        
+        Args:
+            content: Post content
+            image_path: Optional image to attach
+            creds_map: Credentials per platform, e.g. {'twitter': {...}, 'linkedin': {...}}.
+                       Only these platforms are posted to; defaults to all platforms.
+        
+        Returns:
+            Dict mapping platform name to its post result
+        """
+        creds_map = creds_map or {'twitter': None, 'linkedin': None}
+        await self.initialize()
+        
+        platforms = list(creds_map)
+        results = await asyncio.gather(
+            *(self.post_to_platform(p, content, image_path, creds_map[p]) for p in platforms),
+            return_exceptions=True
+        )
+        
+        return {
+            platform: (
+                {'success': False, 'platform': platform, 'error': str(result)}
+                if isinstance(result, BaseException) else result
+            )
+            for platform, result in zip(platforms, results)
+        }
+    
     async def __aenter__(self):
         await self.initialize()
         return self
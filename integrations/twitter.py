@@ -7,14 +7,64 @@ This version has more robust selectors and better error handling.
 """
 
 import asyncio
+import base64
+import json
 import os
+import re
+import time
+import random
+import sys
 import logging
-from typing import Dict, Any, Optional
-from playwright.async_api import async_playwright, Browser, Page, TimeoutError as PlaywrightTimeout
+from typing import Dict, Any, Final, Optional
+from playwright.async_api import Browser, Page, Playwright, TimeoutError as PlaywrightTimeout
 from pathlib import Path
+from integrations._browser_pool import get_browser, get_playwright, acquire_context, release_context, shutdown_pool
+from integrations._debug_dump import dump_debug_files
+from integrations._paths import media_dirs, resolve_chrome
 
 logger = logging.getLogger('allisson')
 
+_CONTEXT_OPTIONS = dict(
+    viewport={'width': 1920, 'height': 1080},
+    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    locale='en-US',
+    timezone_id='America/New_York',
+)
+
+# Resource types the login/post flows never need rendered
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font'})
+# Analytics/telemetry endpoints that keep the network busy
+_BLOCKED_URL_PARTS = ('google-analytics.com', 'doubleclick.net', '/i/api/1.1/jot/')
+
+# Selectors, built once per process
+# Any of these is the password field; CSS "," matches whichever renders
+_PASSWORD_SELECTOR: Final[str] = ",".join([
+    'input[name="password"]',
+    'input[type="password"]',
+    'input[autocomplete="current-password"]',
+    'input[data-testid="password"]',
+    'input[aria-label="Password"]',
+    'input[aria-label*="password" i]',
+    'input[placeholder*="password" i]',
+    'input[id*="password" i]',
+])
+_NEW_TWEET_BTN: Final[str] = '[data-testid="SideNav_NewTweet_Button"]'
+_TWEET_TEXTAREA: Final[str] = '[data-testid="tweetTextarea_0"]'
+# Inline composer and compose modal use different test ids
+_POST_BTN: Final[str] = '[data-testid="tweetButtonInline"],[data-testid="tweetButton"]'
+
+_STEALTH_JS = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+"""
+
+# username -> storage_state of a session verified in this process
+_STATE_CACHE: Dict[str, Dict[str, Any]] = {}
+
+# Accessible name of the login flow's advance button
+_NEXT_BUTTON_NAME = re.compile(r'^(Next|Continue)$', re.I)
+
 
 class TwitterAutomationFixed:
     """
@@ -28,40 +78,39 @@ class TwitterAutomationFixed:
         self.platform = "twitter"
         
         # Directories
-        base_dir = Path(__file__).resolve().parent.parent
-        self.sessions_dir = base_dir / 'media' / 'sessions'
-        self.screenshots_dir = base_dir / 'media' / 'screenshots'
-        
-        self.sessions_dir.mkdir(parents=True, exist_ok=True)
-        self.screenshots_dir.mkdir(parents=True, exist_ok=True)
+        self.sessions_dir, self.screenshots_dir = media_dirs()
         
         self.session_file = self.sessions_dir / f'{self.platform}_session.json'
+        # With TWITTER_PERSISTENT_PROFILE=1 a real Chrome profile replaces the session JSON
+        self.profile_dir = self.sessions_dir / f'{self.platform}_profile'
+        self.persistent = os.getenv('TWITTER_PERSISTENT_PROFILE') == '1'
         self.console_messages = []
+        # Human-like pauses between steps; TWITTER_SLOWMO=0 skips them (e.g. headless CI)
+        self.slow_mo: bool = bool(int(os.getenv('TWITTER_SLOWMO', '1')))
+        # Step-by-step screenshots are opt-in; error screenshots are always taken
+        self.debug_screenshots = os.getenv('TWITTER_DEBUG_SHOTS') == '1'
+        self._verified_user: Optional[str] = None  # Set when the context came from _STATE_CACHE
+        self._cdp = None  # CDP session for debug screenshots, bound to _cdp_page
+        self._cdp_page = None
+        # Abort images/fonts/media while True; cleared before attaching an image
+        self.block_resources = True
     
-    async def start_browser(self, headless: bool = False, use_chrome: bool = True, chrome_path: Optional[str] = None):
-        """Start browser - default to VISIBLE mode for debugging.
+    async def _launch(self, playwright: Playwright, headless: bool, use_chrome: bool = True,
+                      chrome_path: Optional[str] = None) -> Browser:
+        """Launch system Chrome; used by the shared browser pool on first use.
 
-        If `use_chrome` is True, attempt to launch the system Chrome/Chromium binary.
-        You can also pass an explicit `chrome_path` or set the `CHROME_PATH` env var.
+        If `CHROME_CDP_URL` is set (see scripts/run_chrome_cdp.sh), attach to that
+        already-running Chrome instead of launching a new one.
         """
-        playwright = await async_playwright().start()
+        cdp_url = os.getenv('CHROME_CDP_URL')
+        if cdp_url:
+            logger.info(f"Connecting to running Chrome at {cdp_url}")
+            return await playwright.chromium.connect_over_cdp(cdp_url)
+        
+        browser = None
 
         # Determine executable path for system Chrome if requested
-        exec_path = None
-        if use_chrome:
-            import shutil
-            # Use provided chrome_path, environment variable, or try common locations
-            # Prioritize Google Chrome only; exclude plain Chromium
-            env_path = os.getenv('CHROME_PATH')
-            candidates = [chrome_path, env_path, '/usr/bin/google-chrome-stable', '/usr/bin/google-chrome', '/opt/google/chrome/google-chrome']
-            for c in [p for p in candidates if p]:
-                try:
-                    # shutil.which works for names in PATH; os.path.exists checks full paths
-                    if shutil.which(c) or os.path.exists(c):
-                        exec_path = c
-                        break
-                except Exception:
-                    continue
+        exec_path = resolve_chrome(chrome_path) if use_chrome else None
 
         launch_kwargs = dict(
             headless=headless,
@@ -81,97 +130,193 @@ class TwitterAutomationFixed:
                 ch_kwargs['channel'] = 'chrome'
                 # channel should not include executable_path
                 ch_kwargs.pop('executable_path', None)
-                print(f"[DEBUG] Attempting launch with Playwright channel='chrome' (no executable_path)")
-                self.browser = await playwright.chromium.launch(**ch_kwargs)
+                logger.debug(f"Attempting launch with Playwright channel='chrome' (no executable_path)")
+                browser = await playwright.chromium.launch(**ch_kwargs)
             except Exception as e_chan:
                 last_exc = e_chan
-                print(f"[DEBUG] channel='chrome' launch failed: {e_chan}")
+                logger.debug(f"channel='chrome' launch failed: {e_chan}")
                 # If exec_path was resolved, try launching directly with it
                 if exec_path:
                     try:
                         launch_kwargs['executable_path'] = exec_path
-                        print(f"[DEBUG] Attempting launch with executable_path: {exec_path}")
-                        self.browser = await playwright.chromium.launch(**launch_kwargs)
+                        logger.debug(f"Attempting launch with executable_path: {exec_path}")
+                        browser = await playwright.chromium.launch(**launch_kwargs)
                     except Exception as e_exec:
                         last_exc = e_exec
-                        print(f"[DEBUG] executable_path launch failed: {e_exec}")
+                        logger.debug(f"executable_path launch failed: {e_exec}")
                 # Do NOT fall back to bundled Chromium: fail explicitly so the user fixes Chrome setup
-                if not getattr(self, 'browser', None):
-                    print("[DEBUG] No system Chrome available and bundled Chromium fallback disabled")
+                if not browser:
+                    logger.debug("No system Chrome available and bundled Chromium fallback disabled")
         else:
             # Script configured to NOT use system Chrome; we require explicit system Chrome only
             raise RuntimeError("Chromium use is disabled in this script. Set use_chrome=True and ensure CHROME_PATH or Playwright channel='chrome' is available.")
 
-        # Print debug info to console so it's visible even if logging not configured
-        import sys as _sys
-        print(f"[DEBUG] python executable: {_sys.executable}")
-        print(f"[DEBUG] CHROME_PATH env: {os.getenv('CHROME_PATH')}")
-        print(f"[DEBUG] resolved exec_path: {exec_path}")
-        print(f"[DEBUG] launch kwargs (no args): { {k:v for k,v in launch_kwargs.items() if k!='args'} }")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"python executable: {sys.executable}")
+            logger.debug(f"CHROME_PATH env: {os.getenv('CHROME_PATH')}")
+            logger.debug(f"resolved exec_path: {exec_path}")
+            logger.debug(f"launch kwargs (no args): { {k:v for k,v in launch_kwargs.items() if k!='args'} }")
 
-        if not getattr(self, 'browser', None):
+        if not browser:
             # Nothing started
             raise RuntimeError(
                 "Failed to launch system Chrome. Ensure Google Chrome/Chromium is installed, CHROME_PATH is set to the binary path, or Playwright's 'chrome' channel is available."
             )
+        return browser
+    
+    async def start_browser(self, headless: bool = False, use_chrome: bool = True, chrome_path: Optional[str] = None,
+                            browser: Optional[Browser] = None, username: Optional[str] = None):
+        """Start browser - default to VISIBLE mode for debugging.
+
+        If `use_chrome` is True, attempt to launch the system Chrome/Chromium binary.
+        You can also pass an explicit `chrome_path` or set the `CHROME_PATH` env var.
+        The browser is shared process-wide; this instance only gets its own context.
+        Pass `browser` to run inside an already-running browser instead.
+        Pass `username` to reuse that account's session if it was already
+        verified in this process; login() then returns without any page load.
+        With `username`, session_file and profile_dir are that account's own
+        files, and the shared single-account session is never loaded.
         
-        # Load saved session if available
-        storage_state = None
-        if self.session_file.exists():
-            logger.info(f"Loading saved session from {self.session_file}")
-            storage_state = str(self.session_file)
+        With `self.persistent` set (and no `browser` given), Chrome runs on its own
+        on-disk profile in `profile_dir`, which keeps cookies, cache and storage
+        between runs without the session JSON.
+        """
+        if username:
+            self._use_account(username)
+        if self.persistent and browser is None:
+            await self._start_persistent(headless, chrome_path)
+        else:
+            self.browser = browser or await get_browser(
+                lambda playwright: self._launch(playwright, headless, use_chrome, chrome_path)
+            )
+            
+            # Load saved session if available
+            storage_state = None
+            if username in _STATE_CACHE:
+                storage_state = _STATE_CACHE[username]
+                self._verified_user = username
+            elif self.session_file.exists():
+                logger.info(f"Loading saved session from {self.session_file}")
+                storage_state = str(self.session_file)
+            
+            self.context = await acquire_context(self.browser, storage_state=storage_state, **_CONTEXT_OPTIONS)
         
-        self.context = await self.browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            locale='en-US',
-            timezone_id='America/New_York',
-            storage_state=storage_state,
+        # Register the stealth script and route handler while the page opens;
+        # both are in place before start_browser() returns and anything navigates
+        setup = asyncio.gather(
+            self.context.add_init_script(_STEALTH_JS),
+            self.context.route('**/*', self._route_request),
         )
+        self.page = self.context.pages[0] if self.context.pages else await self.context.new_page()
         
-        await self.context.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-        """)
+        # Bind the compose-flow locators to this page once; login and every post reuse them
+        self.loc_compose_btn = self.page.locator(_NEW_TWEET_BTN)
+        self.loc_tweet_textarea = self.page.locator(_TWEET_TEXTAREA)
+        self.loc_post_btn = self.page.locator(_POST_BTN).first
         
-        self.page = await self.context.new_page()
-        ua = None
-        try:
+        # Collect console messages for debugging
+        self.console_messages = []
+        def _on_console(msg):
+            try:
+                self.console_messages.append(f"{msg.type}: {msg.text}")
+            except Exception:
+                pass
+        self.page.on("console", _on_console)
+        
+        await setup
+        if logger.isEnabledFor(logging.DEBUG):
             ua = await self.page.evaluate("() => navigator.userAgent")
-        except Exception:
-            pass
-        print(f"[DEBUG] Browser started. navigator.userAgent: {ua}")
+            logger.debug(f"Browser started. navigator.userAgent: {ua}")
         logger.info("Browser started successfully")
-        # Collect console messages for debugging
+    
+    def _use_account(self, username: str):
+        """Key session_file and profile_dir by account, so accounts never share a login."""
+        key = re.sub(r'[^\w.-]', '_', username.lstrip('@').lower())
+        self.session_file = self.sessions_dir / f'{self.platform}_session_{key}.json'
+        self.profile_dir = self.sessions_dir / f'{self.platform}_profile_{key}'
+    
+    async def _start_persistent(self, headless: bool, chrome_path: Optional[str] = None):
+        """Open a dedicated Chrome on the persistent profile; not shared with the pool."""
+        playwright = await get_playwright()
+        launch_kwargs = dict(
+            user_data_dir=str(self.profile_dir),
+            headless=headless,
+            args=['--disable-blink-features=AutomationControlled', '--disable-dev-shm-usage', '--no-sandbox'],
+            **_CONTEXT_OPTIONS,
+        )
+        exec_path = resolve_chrome(chrome_path)
         try:
-            self.console_messages = []
-            def _on_console(msg):
-                try:
-                    self.console_messages.append(f"{msg.type}: {msg.text}")
-                except Exception:
-                    pass
-            self.page.on("console", _on_console)
-        except Exception:
-            pass
+            self.context = await playwright.chromium.launch_persistent_context(channel='chrome', **launch_kwargs)
+        except Exception as e_chan:
+            if not exec_path:
+                raise
+            logger.debug(f"channel='chrome' persistent launch failed: {e_chan}")
+            self.context = await playwright.chromium.launch_persistent_context(executable_path=exec_path, **launch_kwargs)
+        self.browser = self.context.browser
+        logger.info(f"Using persistent Chrome profile: {self.profile_dir}")
+    
+    async def _route_request(self, route):
+        """Drop trackers always, and heavy assets while block_resources is set."""
+        request = route.request
+        if any(part in request.url for part in _BLOCKED_URL_PARTS) or (
+            self.block_resources and request.resource_type in _BLOCKED_RESOURCE_TYPES
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
     
     async def close_browser(self):
-        if self.browser:
-            await self.browser.close()
-            logger.info("Browser closed")
+        """Close this instance's context; call shutdown_pool() to stop the shared browser."""
+        if self.context:
+            if self.persistent and self.context.browser is None:
+                await self.context.close()
+            else:
+                await release_context(self.context)
+            self.context = None
+            self.page = None
+            logger.info("Browser context closed")
     
     async def human_delay(self, min_seconds: float = 1.0, max_seconds: float = 3.0):
-        import random
-        delay = random.uniform(min_seconds, max_seconds)
-        await asyncio.sleep(delay)
+        if not self.slow_mo:
+            return
+        await asyncio.sleep(random.uniform(min_seconds, max_seconds))
     
     async def save_screenshot(self, filename: str):
-        if self.page:
+        """Full-page PNG for error shots; viewport JPEG step shots only with TWITTER_DEBUG_SHOTS=1."""
+        if not self.page:
+            return None
+        if 'error' in filename:
             screenshot_path = self.screenshots_dir / filename
             await self.page.screenshot(path=str(screenshot_path), full_page=True)
-            logger.info(f"Screenshot saved: {screenshot_path}")
-            return str(screenshot_path)
-        return None
+        elif self.debug_screenshots:
+            # Raw CDP capture: viewport-only JPEG, no Playwright stitching or re-layout
+            screenshot_path = self.screenshots_dir / Path(filename).with_suffix('.jpg')
+            if self._cdp is None or self._cdp_page is not self.page:
+                self._cdp = await self.context.new_cdp_session(self.page)
+                self._cdp_page = self.page
+            res = await self._cdp.send('Page.captureScreenshot', {'format': 'jpeg', 'quality': 60})
+            await asyncio.to_thread(screenshot_path.write_bytes, base64.b64decode(res['data']))
+        else:
+            return None
+        logger.info(f"Screenshot saved: {screenshot_path}")
+        return str(screenshot_path)
+    
+    async def _has_auth_cookie(self) -> bool:
+        """True if the context holds an unexpired auth_token cookie for Twitter/X."""
+        now = time.time()
+        cookies = await self.context.cookies(['https://twitter.com', 'https://x.com'])
+        # expires is -1 for session cookies, which last as long as the context
+        return any(
+            c['name'] == 'auth_token' and (c.get('expires', -1) == -1 or c['expires'] > now)
+            for c in cookies
+        )
+    
+    async def _dump_debug_files(self):
+        """Save an error screenshot, the page HTML and the console log, off the event loop."""
+        await dump_debug_files(
+            self.page, self.screenshots_dir, self.console_messages,
+            self.save_screenshot('twitter_error_no_password_field.png'),
+        )
     
     async def login(self, username: str, password: str, email: Optional[str] = None) -> bool:
         """
@@ -180,21 +325,28 @@ class TwitterAutomationFixed:
         try:
             logger.info("Starting Twitter login...")
             
+            if username and username == self._verified_user:
+                logger.info("✅ Logged in using session verified earlier in this run")
+                return True
+            
             # If session was loaded during context creation, verify it's still valid
-            if self.session_file.exists():
+            if self.session_file.exists() or (self.persistent and self.profile_dir.exists()):
                 logger.info("Verifying saved session...")
+                if await self._has_auth_cookie():
+                    # Trust the cookie; the next page action re-verifies the session
+                    logger.info("✅ Logged in using saved session (auth cookie present)")
+                    return True
                 try:
-                    await self.page.goto('https://twitter.com/home', wait_until='networkidle', timeout=30000)
+                    await self.page.goto('https://twitter.com/home', wait_until='domcontentloaded', timeout=15000)
                     
                     # Check if we're actually logged in
-                    await asyncio.sleep(4)
                     if 'home' in self.page.url or 'twitter.com' in self.page.url:
-                        # Verify by looking for compose button
+                        # Verify by looking for compose button; it only renders once the app is ready
                         try:
-                            await self.page.wait_for_selector('[data-testid="SideNav_NewTweet_Button"]', timeout=5000)
+                            await self.loc_compose_btn.wait_for(timeout=10000)
                             logger.info("✅ Logged in using saved session")
                             return True
-                        except:
+                        except PlaywrightTimeout:
                             logger.info("Session expired or invalid, will login fresh")
                 except Exception as e:
                     logger.info(f"Session verification failed: {e}, will login fresh")
@@ -206,9 +358,9 @@ class TwitterAutomationFixed:
             # Navigate to login page with reasonable timeout
             logger.info("Navigating to Twitter login...")
             try:
-                await self.page.goto('https://twitter.com/i/flow/login', wait_until='networkidle', timeout=45000)
+                await self.page.goto('https://twitter.com/i/flow/login', wait_until='domcontentloaded', timeout=15000)
             except Exception as e:
-                logger.warning(f"Network idle timeout: {e}, continuing with page in current state...")
+                logger.warning(f"Navigation timeout: {e}, continuing with page in current state...")
             
             # Wait for username input to appear - using selector only (no eval due to CSP)
             logger.info("Waiting for login form to load...")
@@ -233,23 +385,18 @@ class TwitterAutomationFixed:
                 )
                 await username_input.click()
                 await self.human_delay(0.5, 1)
-                await username_input.type(username, delay=50)  # Type with 50ms delay between keys
+                if self.slow_mo:
+                    await username_input.type(username, delay=50)  # Type with 50ms delay between keys
+                else:
+                    await username_input.fill(username)
                 await self.human_delay(1, 2)
                 await self.save_screenshot('twitter_02_username_entered.png')
                 
                 # Look for Next button with aria-label
                 logger.info("Looking for Next button...")
-                next_button = None
-                buttons = await self.page.query_selector_all('button')
-                for btn in buttons:
-                    try:
-                        aria_label = await btn.get_attribute('aria-label')
-                        if aria_label and 'next' in aria_label.lower():
-                            logger.info(f"Found Next button with aria-label: {aria_label}")
-                            next_button = btn
-                            break
-                    except:
-                        pass
+                next_button = await self.page.query_selector(
+                    'button[aria-label*="Next" i], button[data-testid*="Next"]'
+                )
                 
                 if next_button:
                     await next_button.click()
@@ -261,14 +408,6 @@ class TwitterAutomationFixed:
                 # Wait for page to transition after clicking Next
                 logger.info("Waiting for page to transition after username entry...")
                 await self.human_delay(3, 4)
-                
-                # Wait for either password field OR url change
-                try:
-                    await self.page.wait_for_load_state('networkidle', timeout=8000)
-                except Exception as e:
-                    logger.debug(f"Network idle wait timed out (OK): {e}")
-                
-                await self.human_delay(1, 2)
                 await self.save_screenshot('twitter_03_after_username.png')
                 
             except PlaywrightTimeout:
@@ -302,31 +441,12 @@ class TwitterAutomationFixed:
             # Step 3: Enter password
             logger.info("Step 3: Entering password...")
             try:
-                # Try multiple common selectors for the password field (broader search)
-                password_selectors = [
-                    'input[name="password"]',
-                    'input[type="password"]',
-                    'input[autocomplete="current-password"]',
-                    'input[data-testid="password"]',
-                    'input[aria-label="Password"]',
-                    'input[aria-label*="password" i]',
-                    'input[placeholder*="password" i]',
-                    'input[id*="password" i]',
-                ]
-
                 password_input = None
-                for sel in password_selectors:
-                    try:
-                        logger.info(f"  Trying selector: {sel}")
-                        password_input = await self.page.wait_for_selector(sel, timeout=2000)
-                        if password_input:
-                            logger.info(f"✅ Found password input using selector: {sel}")
-                            break
-                    except PlaywrightTimeout:
-                        continue
-                    except Exception as e:
-                        logger.debug(f"  Selector failed: {e}")
-                        continue
+                try:
+                    password_input = await self.page.wait_for_selector(_PASSWORD_SELECTOR, timeout=8000)
+                    logger.info("✅ Found password input")
+                except PlaywrightTimeout:
+                    pass
 
                 # If password field still not found, try clicking any visible "Next"/"Log in" button and retry
                 if not password_input:
@@ -335,59 +455,27 @@ class TwitterAutomationFixed:
                     # Log current URL and page details
                     logger.info(f"Current URL: {self.page.url}")
                     
-                    # Try to find and click "Next" button using text content
+                    # Try to find and click a "Next"/"Continue" button by its accessible name
                     try:
-                        all_buttons = await self.page.query_selector_all('button')
-                        logger.info(f"Found {len(all_buttons)} buttons on page")
-                        
-                        for i, btn in enumerate(all_buttons[:20]):  # Check first 20 buttons
-                            try:
-                                btn_text = await btn.text_content()
-                                if btn_text:
-                                    logger.debug(f"  Button {i}: '{btn_text.strip()}'")
-                                    if btn_text.strip().lower() in ['next', 'continue']:
-                                        logger.info(f"Clicking button with text: {btn_text.strip()}")
-                                        await btn.click()
-                                        await self.human_delay(3, 5)
-                                        break
-                            except Exception as e_btn:
-                                logger.debug(f"Error checking button {i}: {e_btn}")
+                        next_button = self.page.get_by_role('button', name=_NEXT_BUTTON_NAME).first
+                        if await next_button.count():
+                            logger.info("Clicking Next/Continue button")
+                            await next_button.click(timeout=5000)
+                            await self.human_delay(3, 5)
                     except Exception as e:
-                        logger.debug(f"Error finding buttons: {e}")
+                        logger.debug(f"Error clicking Next/Continue button: {e}")
 
                     # After attempting Next, retry finding the password field with longer timeout
                     logger.info("Retrying password field detection after button click...")
-                    for sel in password_selectors:
-                        try:
-                            password_input = await self.page.wait_for_selector(sel, timeout=5000)
-                            if password_input:
-                                logger.info(f"Found password input after clicking button using selector: {sel}")
-                                break
-                        except PlaywrightTimeout:
-                            continue
+                    try:
+                        password_input = await self.page.wait_for_selector(_PASSWORD_SELECTOR, timeout=5000)
+                        logger.info("Found password input after clicking button")
+                    except PlaywrightTimeout:
+                        pass
 
                 if not password_input:
                     logger.error("Password input not found after retries")
-                    await self.save_screenshot('twitter_error_no_password_field.png')
-                    # Save full page HTML for debugging
-                    try:
-                        page_html = await self.page.content()
-                        html_path = self.screenshots_dir / 'twitter_error_page.html'
-                        html_path.write_text(page_html, encoding='utf-8')
-                        logger.info(f"Saved page HTML: {html_path}")
-                    except Exception as e_html:
-                        logger.warning(f"Failed to save page HTML: {e_html}")
-
-                    # Save console messages
-                    try:
-                        log_path = self.screenshots_dir / 'twitter_error_console.log'
-                        with open(log_path, 'w', encoding='utf-8') as f:
-                            f.write('\n'.join(self.console_messages or []))
-                        logger.info(f"Saved console log: {log_path}")
-                    except Exception as e_log:
-                        logger.warning(f"Failed to save console log: {e_log}")
-
-                    print(f"[DEBUG] Saved debugging files: {html_path} {log_path}")
+                    await self._dump_debug_files()
                     return False
 
                 await password_input.click()
@@ -414,8 +502,12 @@ class TwitterAutomationFixed:
                 
                 # Verify we're actually on home page
                 if 'home' in self.page.url:
-                    # Save session for future use
-                    await self.context.storage_state(path=str(self.session_file))
+                    # Save session for future use (a persistent profile keeps it on its own)
+                    if not self.persistent:
+                        state = await self.context.storage_state()
+                        _STATE_CACHE[username] = state
+                        self._verified_user = username
+                        await asyncio.to_thread(self.session_file.write_text, json.dumps(state), encoding='utf-8')
                     logger.info("✅ Twitter login successful - Session saved")
                     return True
                 else:
@@ -443,54 +535,42 @@ class TwitterAutomationFixed:
             # Make sure we're on home page
             if 'home' not in self.page.url:
                 logger.info("Navigating to home page...")
-                await self.page.goto('https://twitter.com/home', wait_until='networkidle', timeout=30000)
+                await self.page.goto('https://twitter.com/home', wait_until='domcontentloaded', timeout=15000)
                 await self.human_delay(2, 3)
             
             await self.save_screenshot('twitter_07_before_compose.png')
             
-            # Method 1: Try clicking the compose button in sidebar
+            # Whichever shows first: the sidebar compose button (opens the modal)
+            # or the inline "What's happening" box
+            logger.info("Looking for compose area...")
             try:
-                logger.info("Method 1: Looking for compose button...")
-                compose_button = await self.page.wait_for_selector(
-                    '[data-testid="SideNav_NewTweet_Button"]',
-                    timeout=10000
-                )
-                await compose_button.click()
-                await self.human_delay(2, 3)
-                await self.save_screenshot('twitter_08_compose_clicked.png')
-            except:
-                logger.info("Method 1 failed, trying Method 2...")
-                
-                # Method 2: Try clicking in the "What's happening" box
-                try:
-                    tweet_box = await self.page.wait_for_selector(
-                        '[data-testid="tweetTextarea_0"]',
-                        timeout=10000
-                    )
-                    await tweet_box.click()
+                target = await self.page.wait_for_selector(f'{_NEW_TWEET_BTN},{_TWEET_TEXTAREA}', timeout=10000)
+                await target.click()
+                if await target.get_attribute('data-testid') == 'SideNav_NewTweet_Button':
+                    await self.human_delay(2, 3)
+                    await self.save_screenshot('twitter_08_compose_clicked.png')
+                else:
                     await self.human_delay(1, 2)
-                except:
-                    logger.error("Could not find tweet compose area")
-                    await self.save_screenshot('twitter_error_no_compose.png')
-                    return {
-                        'success': False,
-                        'platform': 'twitter',
-                        'error': 'Could not find tweet compose area'
-                    }
+            except PlaywrightTimeout:
+                logger.error("Could not find tweet compose area")
+                await self.save_screenshot('twitter_error_no_compose.png')
+                return {
+                    'success': False,
+                    'platform': 'twitter',
+                    'error': 'Could not find tweet compose area'
+                }
             
-            # Type the tweet content
+            # Type the tweet content (fill() waits for the textarea itself)
             logger.info("Typing tweet content...")
-            tweet_input = await self.page.wait_for_selector(
-                '[data-testid="tweetTextarea_0"]',
-                timeout=15000
-            )
-            await tweet_input.fill(content)
+            await self.loc_tweet_textarea.fill(content, timeout=15000)
             await self.human_delay(2, 3)
             await self.save_screenshot('twitter_09_content_entered.png')
             
             # Upload image if provided
             if image_path and os.path.exists(image_path):
                 logger.info(f"Uploading image: {image_path}")
+                # Let the media preview load so the upload registers
+                was_blocking, self.block_resources = self.block_resources, False
                 try:
                     file_input = await self.page.query_selector('input[type="file"][accept*="image"]')
                     if file_input:
@@ -499,44 +579,24 @@ class TwitterAutomationFixed:
                         await self.save_screenshot('twitter_10_image_uploaded.png')
                 except Exception as e:
                     logger.warning(f"Image upload failed: {e}")
+                finally:
+                    self.block_resources = was_blocking
             
             # Click the Post button
             logger.info("Clicking Post button...")
             try:
-                # Try multiple possible selectors for the post button
-                post_button = None
-                
-                # Try selector 1
-                try:
-                    post_button = await self.page.wait_for_selector(
-                        '[data-testid="tweetButtonInline"]',
-                        timeout=5000
-                    )
-                except:
-                    pass
-                
-                # Try selector 2 if first failed
-                if not post_button:
-                    try:
-                        post_button = await self.page.wait_for_selector(
-                            '[data-testid="tweetButton"]',
-                            timeout=5000
-                        )
-                    except:
-                        pass
-                
-                if not post_button:
-                    logger.error("Could not find Post button")
-                    await self.save_screenshot('twitter_error_no_post_button.png')
-                    return {
-                        'success': False,
-                        'platform': 'twitter',
-                        'error': 'Could not find Post button'
-                    }
-                
-                await post_button.click()
+                # click() waits for whichever post button renders
+                await self.loc_post_btn.click(timeout=7000)
                 logger.info("Post button clicked!")
                 
+            except PlaywrightTimeout:
+                logger.error("Could not find Post button")
+                await self.save_screenshot('twitter_error_no_post_button.png')
+                return {
+                    'success': False,
+                    'platform': 'twitter',
+                    'error': 'Could not find Post button'
+                }
             except Exception as e:
                 logger.error(f"Error clicking post button: {e}")
                 await self.save_screenshot('twitter_error_post_click.png')
@@ -552,12 +612,9 @@ class TwitterAutomationFixed:
             
             # Try to get tweet URL
             tweet_url = "Posted successfully"
-            try:
-                current_url = self.page.url
-                if '/status/' in current_url:
-                    tweet_url = current_url
-            except:
-                pass
+            current_url = self.page.url or ''
+            if '/status/' in current_url:
+                tweet_url = current_url
             
             logger.info(f"✅ Tweet posted successfully: {tweet_url}")
             
@@ -566,7 +623,7 @@ class TwitterAutomationFixed:
                 'platform': 'twitter',
                 'content': content,
                 'url': tweet_url,
-                'timestamp': asyncio.get_event_loop().time()
+                'timestamp': time.monotonic()
             }
             
         except Exception as e:
@@ -579,6 +636,46 @@ class TwitterAutomationFixed:
             }
 
 
+class TwitterSession(TwitterAutomationFixed):
+    """
+    One account's context inside a shared browser, for running many accounts at once.
+    """
+    
+    def __init__(self, browser: Browser):
+        super().__init__()
+        self.browser = browser
+    
+    async def run(self, account: Dict[str, str]) -> Dict[str, Any]:
+        """
+        Log in and post for one account.
+        
+        Args:
+            account: Dict with 'username', 'password', 'content' and optional 'email'/'image_path'
+        """
+        await self.start_browser(browser=self.browser, username=account['username'])
+        try:
+            if not await self.login(account['username'], account['password'], account.get('email')):
+                return {'success': False, 'platform': self.platform, 'error': 'Login failed'}
+            return await self.post_tweet(account['content'], account.get('image_path'))
+        finally:
+            await self.close_browser()
+
+
+async def run_many(accounts, headless: bool = True):
+    """Post for several accounts concurrently, one context each on one browser."""
+    launcher = TwitterAutomationFixed()
+    browser = await get_browser(lambda playwright: launcher._launch(playwright, headless))
+    results = await asyncio.gather(
+        *(TwitterSession(browser).run(account) for account in accounts),
+        return_exceptions=True,
+    )
+    return [
+        {'success': False, 'platform': 'twitter', 'error': str(result)}
+        if isinstance(result, BaseException) else result
+        for result in results
+    ]
+
+
 # Quick test function
 async def test_twitter_post():
     """Test the fixed Twitter automation"""
@@ -628,6 +725,7 @@ async def test_twitter_post():
     
     finally:
         await twitter.close_browser()
+        await shutdown_pool()
     
     print("\n" + "=" * 70)
     print("✅ Test complete!")
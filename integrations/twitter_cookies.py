@@ -21,16 +21,195 @@ See LOGIN_MANUALLY.md for detailed instructions.
 """
 
 import json
+import re
+import time
+import functools
+import unicodedata
 import logging
 import asyncio
-import aiohttp
+import httpx
 import random
+import urllib.parse
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from pathlib import Path
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+try:
+    import orjson  # Optional: much faster JSON decoding
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads  # Accepts bytes as well
 
 logger = logging.getLogger('allisson')
 
+# One HTTP/2 client to x.com per event loop; concurrent posts multiplex over it.
+# It carries no identity: each request sends its own account's Cookie header
+_SHARED_SESSION: Optional[httpx.AsyncClient] = None
+_SESSION_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_SESSION_LOCK = asyncio.Lock()
+
+# Sent with every request on the shared session
+_DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Referer': 'https://x.com/compose/tweet',
+    'Origin': 'https://x.com',
+    'X-Requested-With': 'XMLHttpRequest',
+}
+
+
+def _bind_loop():
+    """Forget a client created on another (possibly closed) event loop."""
+    global _SHARED_SESSION, _SESSION_LOOP, _SESSION_LOCK
+    loop = asyncio.get_running_loop()
+    if loop is not _SESSION_LOOP:
+        # Its connections belong to the old loop and can't be closed from this one
+        _SHARED_SESSION = None
+        _SESSION_LOOP = loop
+        _SESSION_LOCK = asyncio.Lock()
+
+
+async def close_shared_session():
+    """Close the process-wide session; call once on shutdown."""
+    global _SHARED_SESSION
+    _bind_loop()
+    async with _SESSION_LOCK:
+        if _SHARED_SESSION is not None and not _SHARED_SESSION.is_closed:
+            await _SHARED_SESSION.aclose()
+            logger.info("Session closed")
+        _SHARED_SESSION = None
+
+
+# Cookies without which x.com rejects authenticated requests
+_ESSENTIAL_COOKIES = frozenset(('auth_token', 'ct0'))
+
+# Twitter's weighted length rules (twitter-text config v3): code points in these
+# ranges count 1, everything else (CJK, ...) counts 2; a whole emoji sequence
+# counts 2; URLs, with or without a scheme, count 23 (a domain right after '@'
+# is part of an email address, not a URL); text is measured after NFC normalisation
+_MAX_WEIGHTED_LENGTH = 280
+_LIGHT_RANGES = ((0, 4351), (8192, 8205), (8208, 8223), (8242, 8247))
+_URL_RE = re.compile(
+    r'https?://\S+'
+    r'|(?<![@\w.-])(?:[a-z0-9-]+\.)+(?:com|org|net|edu|gov|io|co|ai|dev|app|me|ly|tv|info|xyz|us|uk|de)\b(?:/\S*)?',
+    re.I,
+)
+_URL_WEIGHT = 23
+# Punctuation ending a sentence after a link; counted as text, not as part of the URL
+_URL_TRAILING = '.,!?;:\'")]'
+
+# Code points that start an emoji on their own (pictographs, dingbats, flags, ...)
+_EMOJI_RANGES = ((0x2300, 0x23FF), (0x2600, 0x27BF), (0x2B00, 0x2BFF), (0x1F000, 0x1FAFF))
+_REGIONAL_INDICATORS = (0x1F1E6, 0x1F1FF)
+_ZWJ = 0x200D
+# Variation selector 16 and the keycap mark turn the preceding character into an emoji
+_PRESENTATION_MARKS = frozenset((0xFE0F, 0x20E3))
+
+
+def _in_ranges(cp: int, ranges) -> bool:
+    return any(lo <= cp <= hi for lo, hi in ranges)
+
+
+def _emoji_end(cps, i: int) -> int:
+    """Index just past the emoji sequence starting at cps[i], or i if none starts there."""
+    n = len(cps)
+    if not (_in_ranges(cps[i], _EMOJI_RANGES) or (i + 1 < n and cps[i + 1] in _PRESENTATION_MARKS)):
+        return i
+    # A flag is a pair of regional indicators
+    if _in_ranges(cps[i], (_REGIONAL_INDICATORS,)) and i + 1 < n and _in_ranges(cps[i + 1], (_REGIONAL_INDICATORS,)):
+        return i + 2
+    j = i + 1
+    while j < n:
+        cp = cps[j]
+        if cp in _PRESENTATION_MARKS or 0x1F3FB <= cp <= 0x1F3FF or 0xE0020 <= cp <= 0xE007F:
+            j += 1  # Presentation mark, skin tone or tag sequence (subdivision flags)
+        elif cp == _ZWJ and j + 1 < n and _in_ranges(cps[j + 1], _EMOJI_RANGES):
+            j += 2  # Joined to the next emoji (families, professions, ...)
+        else:
+            break
+    return j
+
+
+@functools.lru_cache(maxsize=256)
+def _weighted_length(text: str) -> int:
+    """Length of `text` as x.com counts it against the 280 limit."""
+    text = unicodedata.normalize('NFC', text)
+    # Each URL is replaced by just its trailing punctuation, which is counted as text
+    rest, url_count = _URL_RE.subn(lambda m: m[0][len(m[0].rstrip(_URL_TRAILING)):], text)
+    length = _URL_WEIGHT * url_count
+    cps = [ord(ch) for ch in rest]
+    i = 0
+    while i < len(cps):
+        end = _emoji_end(cps, i)
+        if end > i:
+            length += 2
+            i = end
+            continue
+        length += 1 if _in_ranges(cps[i], _LIGHT_RANGES) else 2
+        i += 1
+    return length
+
+
+# statuses/update creates a tweet, so only responses that guarantee nothing was
+# created are retried: 429, and 503 when the server asks us to come back later.
+# Other 5xx can arrive after the tweet went out; a retry would post it twice
+def _retry_after(status: int, headers) -> Optional[float]:
+    """Seconds the server asked us to wait before retrying, or None if not retryable."""
+    if status == 429:
+        return _parse_retry_after(headers) or 0.0
+    if status == 503 and 'retry-after' in headers:
+        return _parse_retry_after(headers) or 0.0
+    return None
+
+
+def _parse_retry_after(headers) -> Optional[float]:
+    try:
+        return max(0.0, float(headers['retry-after']))
+    except (KeyError, ValueError):
+        return None  # Missing, or an HTTP date; fall back to backoff
+
+
+class _TokenBucket:
+    """
+    Async token bucket for pacing posts.
+    
+    Also honours x.com's x-rate-limit-remaining / x-rate-limit-reset headers:
+    once the server says the window is used up, acquire() waits for the reset.
+    """
+    
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate  # Tokens per second
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a request may be sent, then take a token."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+                self._updated = now
+                wait = self._blocked_until - now
+                if wait <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.refill_rate
+                await asyncio.sleep(wait)
+    
+    def update_from_headers(self, headers):
+        """Block until the server's reset time when it reports no requests left."""
+        try:
+            remaining = int(headers['x-rate-limit-remaining'])
+            reset_in = float(headers['x-rate-limit-reset']) - time.time()
+        except (KeyError, ValueError):
+            return
+        if remaining <= 0 and reset_in > 0:
+            logger.warning("⚠️  Rate limit reached, pausing posts for %.0fs", reset_in)
+            self._blocked_until = time.monotonic() + reset_in
+
 
 class TwitterCookieAuth:
     """
@@ -39,12 +218,20 @@ class TwitterCookieAuth:
     This is the PRIMARY approach - no browser automation needed!
     """
     
+    __slots__ = ('base_dir', 'cookies_file', 'cookies', 'cookie_header', 'session', 'user_id', '_rng')
+    
+    # Connection pool settings for the shared client (single host, HTTP/2 multiplexed);
+    # override on the class before the first session is created, e.g. for load tests
+    client_limits = httpx.Limits(max_connections=10, max_keepalive_connections=10, keepalive_expiry=90)
+    
     def __init__(self):
         self.base_dir = Path(__file__).resolve().parent.parent
         self.cookies_file = self.base_dir / 'media' / 'twitter_cookies.json'
         self.cookies = None
+        self.cookie_header = None  # Sent per request, so accounts never share the client's jar
         self.session = None
         self.user_id = None
+        self._rng = random.Random()  # Own RNG for jitter, not the shared module state
         
     async def load_cookies(self) -> bool:
         """
@@ -59,30 +246,48 @@ class TwitterCookieAuth:
             return False
         
         try:
-            with open(self.cookies_file, 'r') as f:
-                self.cookies = json.load(f)
+            # Read off the event loop so other coroutines keep running
+            data = await asyncio.to_thread(self.cookies_file.read_bytes)
+            self.cookies = _json_loads(data)
             
             # Check for essential cookies
-            essential = ['auth_token', 'ct0']
-            missing = [c for c in essential if c not in self.cookies]
+            missing = _ESSENTIAL_COOKIES.difference(self.cookies)
             
             if missing:
-                logger.warning(f"⚠️  Missing essential cookies: {missing}")
+                logger.warning(f"⚠️  Missing essential cookies: {sorted(missing)}")
                 logger.warning("     Try re-exporting from https://x.com")
             
             logger.info(f"✅ Loaded {len(self.cookies)} cookies from {self.cookies_file.name}")
             return True
             
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses it
             logger.error(f"❌ Invalid JSON in cookies file: {e}")
             return False
         except Exception as e:
             logger.error(f"❌ Failed to load cookies: {e}")
             return False
     
+    async def _get_session(self) -> httpx.AsyncClient:
+        """Return the shared client, creating it on first use (or after it was closed)."""
+        global _SHARED_SESSION
+        _bind_loop()
+        async with _SESSION_LOCK:
+            if _SHARED_SESSION is None or _SHARED_SESSION.is_closed:
+                _SHARED_SESSION = httpx.AsyncClient(
+                    http2=True,
+                    base_url='https://x.com',
+                    headers=_DEFAULT_HEADERS,
+                    limits=self.client_limits,
+                    timeout=httpx.Timeout(30.0, connect=10.0, read=20.0),
+                    follow_redirects=True,
+                    # Store nothing from Set-Cookie: a shared jar would mix accounts
+                    cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+                )
+            return _SHARED_SESSION
+    
     async def create_session(self) -> bool:
         """
-        Create authenticated aiohttp session using cookies.
+        Attach to the shared HTTP client and build this account's Cookie header.
         
         Returns:
             True if session created successfully
@@ -92,26 +297,21 @@ class TwitterCookieAuth:
             return False
         
         try:
-            # Create cookie jar from our cookies dict
-            jar = aiohttp.CookieJar()
-            self.session = aiohttp.ClientSession(cookie_jar=jar)
+            self.session = await self._get_session()
             
-            # Manually set cookies
-            for name, value in self.cookies.items():
-                self.session.cookie_jar.update_cookies({name: value}, response_url='https://x.com')
+            # Our cookies go out as an explicit header on each request, never into the shared jar
+            self.cookie_header = '; '.join(f'{name}={value}' for name, value in self.cookies.items())
             
             logger.info("✅ Created authenticated session with cookies")
             return True
             
-        except Exception as e:
-            logger.error(f"Failed to create session: {e}")
+        except Exception:
+            logger.exception("Failed to create session")
             return False
     
     async def close_session(self):
-        """Close the aiohttp session."""
-        if self.session:
-            await self.session.close()
-            logger.info("Session closed")
+        """Detach from the shared session; it stays open for reuse (see close_shared_session())."""
+        self.session = None
 
 
 class TwitterPostAPI:
@@ -119,11 +319,17 @@ class TwitterPostAPI:
     Post tweets using authenticated session (no browser automation).
     """
     
+    __slots__ = ('auth', 'session', 'tweet_url', 'api_host', 'bucket', 'max_retries', '_concurrency')
+    
     def __init__(self, cookies_auth: TwitterCookieAuth):
         self.auth = cookies_auth
         self.session = None
-        self.tweet_url = 'https://x.com/i/api/1.1/statuses/update.json'
+        self.tweet_url = '/i/api/1.1/statuses/update.json'  # Relative to the client's base_url
         self.api_host = 'https://x.com'
+        # Burst of 5 posts, then one every 3 seconds (plus server-side limits)
+        self.bucket = _TokenBucket(capacity=5, refill_rate=1 / 3)
+        self.max_retries = 3
+        self._concurrency = 8  # In-flight requests for post_tweets()
         
     async def setup(self) -> bool:
         """Initialize authenticated session."""
@@ -139,7 +345,7 @@ class TwitterPostAPI:
         Post a tweet using authenticated session.
         
         Args:
-            text: Tweet text (max 280 characters)
+            text: Tweet text (max 280 weighted characters; CJK and emoji count double)
             in_reply_to_id: Optional tweet ID to reply to
         
         Returns:
@@ -151,11 +357,13 @@ class TwitterPostAPI:
                 return {'success': False, 'error': 'Session not initialized'}
             
             # Validate tweet length
-            if len(text) > 280:
-                logger.error(f"Tweet too long: {len(text)} characters (max 280)")
+            # Reject before spending a rate-limit token and a round trip on a certain failure
+            length = _weighted_length(text)
+            if length > _MAX_WEIGHTED_LENGTH:
+                logger.error("Tweet too long: %d weighted characters (max 280)", length)
                 return {'success': False, 'error': 'Tweet exceeds 280 characters'}
             
-            logger.info(f"📝 Posting tweet ({len(text)} chars)...")
+            logger.info("📝 Posting tweet (%d chars)...", len(text))
             
             # Prepare tweet data - API format from X.com
             data = {
@@ -168,55 +376,85 @@ class TwitterPostAPI:
             if in_reply_to_id:
                 data['in_reply_to_status_id'] = in_reply_to_id
             
-            # Set proper headers
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Referer': 'https://x.com/compose/tweet',
-                'Origin': 'https://x.com',
-                'X-Requested-With': 'XMLHttpRequest',
-                'Content-Type': 'application/x-www-form-urlencoded',
-            }
-            
-            # Random delay to appear human-like
-            await asyncio.sleep(random.uniform(2, 4))
+            # Encode the form once; retries resend the same bytes
+            body = urllib.parse.urlencode(data).encode('ascii')
             
-            # POST the tweet
-            async with self.session.post(
-                self.tweet_url,
-                data=data,
-                headers=headers,
-                allow_redirects=True,
-                timeout=aiohttp.ClientTimeout(total=30)
-            ) as resp:
-                logger.debug(f"Response status: {resp.status}")
+            # POST the tweet, paced by the token bucket; retry transient failures with backoff
+            for attempt in range(self.max_retries + 1):
+                await self.bucket.acquire()
+                resp = await self.session.post(
+                    self.tweet_url,
+                    content=body,
+                    headers={
+                        'Content-Type': 'application/x-www-form-urlencoded; charset=utf-8',
+                        'Cookie': self.auth.cookie_header,
+                    },
+                )
+                logger.debug("Response status: %s", resp.status_code)
+                self.bucket.update_from_headers(resp.headers)
+                # Body is already buffered; both branches work from these bytes
+                raw = resp.content
+                status = resp.status_code
                 
-                if resp.status == 200:
-                    response_data = await resp.json()
-                    tweet_id = response_data.get('id_str')
-                    logger.info(f"✅ Tweet posted! ID: {tweet_id}")
-                    return {
-                        'success': True,
-                        'tweet_id': tweet_id,
-                        'text': text,
-                        'url': f'https://x.com/{response_data.get("user", {}).get("screen_name", "unknown")}/status/{tweet_id}',
-                    }
-                else:
-                    resp_text = await resp.text()
-                    logger.error(f"❌ Tweet posting failed (status {resp.status})")
-                    logger.error(f"   Response: {resp_text[:200]}")
-                    return {
-                        'success': False,
-                        'error': f'HTTP {resp.status}',
-                        'details': resp_text[:500],
-                    }
+                retry_after = _retry_after(status, resp.headers)
+                if retry_after is not None and attempt < self.max_retries:
+                    delay = max(retry_after, 2 ** attempt + self.auth._rng.uniform(0, 1))
+                    logger.warning("⚠️  HTTP %s, retrying in %.1fs...", status, delay)
+                    await asyncio.sleep(delay)
+                    continue
+                break
+            
+            if status == 200:
+                response_data = _json_loads(raw)
+                tweet_id = response_data.get('id_str')
+                logger.info("✅ Tweet posted! ID: %s", tweet_id)
+                return {
+                    'success': True,
+                    'tweet_id': tweet_id,
+                    'text': text,
+                    'url': f'https://x.com/{response_data.get("user", {}).get("screen_name", "unknown")}/status/{tweet_id}',
+                }
+            else:
+                # Only the first 500 bytes are reported, so decode just those (error pages can be large)
+                details = raw[:500].decode('utf-8', errors='replace')
+                logger.error("❌ Tweet posting failed (status %s)", status)
+                logger.error("   Response: %s", details[:200])
+                return {
+                    'success': False,
+                    'error': f'HTTP {status}',
+                    'details': details,
+                }
         
-        except asyncio.TimeoutError:
+        except httpx.TimeoutException:
             logger.error("Request timed out")
             return {'success': False, 'error': 'Request timeout'}
         except Exception as e:
-            logger.error(f"Error posting tweet: {e}")
+            logger.error("Error posting tweet: %s", e)
             return {'success': False, 'error': str(e)}
     
+    async def post_tweets(self, texts: List[str], concurrency: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Post several tweets concurrently over the shared session.
+        
+        Args:
+            texts: Tweet texts
+            concurrency: Max requests in flight (defaults to 8)
+        
+        Returns:
+            One result dict per text, in order
+        """
+        sem = asyncio.Semaphore(concurrency or self._concurrency)
+        
+        async def _one(text: str) -> Dict[str, Any]:
+            async with sem:
+                return await self.post_tweet(text)
+        
+        results = await asyncio.gather(*(_one(t) for t in texts), return_exceptions=True)
+        return [
+            {'success': False, 'error': str(r)} if isinstance(r, BaseException) else r
+            for r in results
+        ]
+    
     async def close(self):
         """Close the session."""
         await self.auth.close_session()
@@ -236,6 +474,7 @@ async def demo():
     print(f"Result: {result}")
     
     await api.close()
+    await close_shared_session()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,25 @@
+#!/usr/bin/env bash
+# Start a long-lived Chrome that the Twitter automation can attach to over CDP.
+#
+#   ./scripts/run_chrome_cdp.sh
+#   export CHROME_CDP_URL=http://localhost:9222
+#
+# With CHROME_CDP_URL set, TwitterAutomationFixed connects to this browser
+# instead of launching Chrome on every run.
+
+set -euo pipefail
+
+CHROME_BIN="${CHROME_PATH:-$(command -v google-chrome-stable || command -v google-chrome)}"
+PORT="${CHROME_CDP_PORT:-9222}"
+PROFILE_DIR="${CHROME_CDP_PROFILE:-$(cd "$(dirname "$0")/.." && pwd)/media/chrome-cdp-profile}"
+
+mkdir -p "$PROFILE_DIR"
+
+exec "$CHROME_BIN" \
+    --remote-debugging-port="$PORT" \
+    --user-data-dir="$PROFILE_DIR" \
+    --disable-blink-features=AutomationControlled \
+    --disable-dev-shm-usage \
+    --no-first-run \
+    --no-default-browser-check \
+    "$@"
@@ -6,49 +6,111 @@ This script tests the TwitterAutomation class and the full Hannah agent integrat
 """
 
 import asyncio
+import atexit
+import importlib
 import os
 import logging
+import queue
 import sys
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-# Configure logging
+# Configure logging; records are only enqueued on the event loop and a
+# listener thread writes them, so logging never blocks a Playwright await
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[QueueHandler(_log_queue)],
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger('allisson')
 
+try:
+    import uvloop  # Optional: faster event loop
+except ImportError:
+    _run = asyncio.run
+else:
+    if hasattr(uvloop, 'run'):
+        _run = uvloop.run
+    else:
+        # uvloop.run is new in 0.18; older releases swap the loop policy instead
+        uvloop.install()
+        _run = asyncio.run
 
-async def test_twitter_automation():
-    """Test basic Twitter automation"""
-    from integrations.social_media import TwitterAutomation
-    
-    print("\n" + "="*70)
-    print("🧪 Testing Twitter Automation")
-    print("="*70)
-    
-    twitter = TwitterAutomation()
+
+@lru_cache(maxsize=1)
+def _creds() -> dict:
+    """Load .env once and return the Twitter login kwargs."""
+    from dotenv import load_dotenv
+    load_dotenv()
+    return {
+        'username': os.getenv('TWITTER_USERNAME'),
+        'password': os.getenv('TWITTER_PASSWORD'),
+        'email': os.getenv('TWITTER_EMAIL'),
+    }
+
+
+@lru_cache(maxsize=1)
+def _find_chrome():
+    """Scan PATH once for either Chrome binary name."""
+    for directory in os.environ.get('PATH', '').split(os.pathsep):
+        for name in ('google-chrome-stable', 'google-chrome'):
+            candidate = os.path.join(directory, name)
+            if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+                return candidate
+    return None
+
+
+# headless -> logged-in TwitterAutomation shared by the tests in this process
+_TWITTER = {}
+
+
+@asynccontextmanager
+async def logged_in_twitter(headless: bool = True):
+    """
+    Yield a logged-in TwitterAutomation, or None if login failed.
     
-    try:
-        # Start browser
-        print("\n1️⃣  Starting browser...")
-        await twitter.start_browser(headless=True)  # Set to False to see browser
-        
-        # Login
-        print("2️⃣  Logging in to Twitter...")
-        from dotenv import load_dotenv
-        load_dotenv()
-        
-        success = await twitter.login(
-            username=os.getenv('TWITTER_USERNAME'),
-            password=os.getenv('TWITTER_PASSWORD'),
-            email=os.getenv('TWITTER_EMAIL')
-        )
+    The first successful login per `headless` mode is kept and handed to later
+    tests, so chained tests log in once. It is closed by with_pool_shutdown().
+    """
+    if headless not in _TWITTER:
+        from integrations.social_media import TwitterAutomation
         
+        twitter = TwitterAutomation()
+        try:
+            await twitter.start_browser(headless=headless)
+            success = await twitter.login(**_creds())
+        except BaseException:
+            await twitter.close_browser()
+            raise
         if not success:
+            await twitter.close_browser()
+            yield None
+            return
+        _TWITTER[headless] = twitter
+    yield _TWITTER[headless]
+
+
+async def test_twitter_automation():
+    """Test basic Twitter automation"""
+    print("\n".join([
+        "\n" + "="*70,
+        "🧪 Testing Twitter Automation",
+        "="*70,
+    ]))
+    
+    # Start browser and login
+    print("\n1️⃣  Starting browser and logging in to Twitter...")
+    async with logged_in_twitter(headless=True) as twitter:  # Set to False to see browser
+        if twitter is None:
             print("❌ Login failed - check screenshots in media/screenshots/")
             print("   Look for twitter_error_*.png files for debugging info")
             return False
@@ -56,7 +118,7 @@ async def test_twitter_automation():
         print("✅ Login successful!")
         
         # Post a test tweet
-        print("3️⃣  Posting a test tweet...")
+        print("2️⃣  Posting a test tweet...")
         result = await twitter.post_tweet(
             "Test tweet from Playwright automation! 🤖 #automation"
         )
@@ -69,18 +131,17 @@ async def test_twitter_automation():
             print(f"❌ Tweet posting failed: {result.get('error')}")
             print("   Check screenshots in media/screenshots/twitter_error_*.png")
             return False
-    
-    finally:
-        await twitter.close_browser()
 
 
 async def test_hannah_agent():
     """Test Hannah agent for Twitter posting"""
     from agents.hannah import HannahAgent
     
-    print("\n" + "="*70)
-    print("🧪 Testing Hannah Agent")
-    print("="*70)
+    print("\n".join([
+        "\n" + "="*70,
+        "🧪 Testing Hannah Agent",
+        "="*70,
+    ]))
     
     hannah = HannahAgent()
     
@@ -91,9 +152,11 @@ async def test_hannah_agent():
     )
     
     if result.get('success'):
-        print("✅ Hannah agent execution successful!")
-        print(f"   Task ID: {result.get('task_id')}")
-        print(f"   Execution time: {result.get('execution_time'):.2f}s")
+        print("\n".join([
+            "✅ Hannah agent execution successful!",
+            f"   Task ID: {result.get('task_id')}",
+            f"   Execution time: {result.get('execution_time'):.2f}s",
+        ]))
         
         # Show final result
         final = result.get('result', {})
@@ -103,40 +166,24 @@ async def test_hannah_agent():
                 print(f"✅ Tweet posted: {output.get('url')}")
                 return True
     
-    print(f"❌ Hannah agent execution failed")
-    print(f"   Result: {result}")
+    print(f"❌ Hannah agent execution failed\n   Result: {result}")
     return False
 
 
 async def test_twitter_with_visibility():
     """Test Twitter automation with visible browser"""
-    from integrations.social_media import TwitterAutomation
+    print("\n".join([
+        "\n" + "="*70,
+        "🧪 Testing Twitter Automation (VISIBLE BROWSER)",
+        "="*70,
+        "\n⚠️  This test shows the browser in action for debugging.",
+        "   The browser will open automatically. Watch the login process.",
+    ]))
     
-    print("\n" + "="*70)
-    print("🧪 Testing Twitter Automation (VISIBLE BROWSER)")
-    print("="*70)
-    print("\n⚠️  This test shows the browser in action for debugging.")
-    print("   The browser will open automatically. Watch the login process.")
-    
-    twitter = TwitterAutomation()
-    
-    try:
-        # Start browser in VISIBLE mode
-        print("\n1️⃣  Starting visible browser...")
-        await twitter.start_browser(headless=False)
-        
-        # Login
-        print("2️⃣  Logging in to Twitter (you can see the browser)...")
-        from dotenv import load_dotenv
-        load_dotenv()
-        
-        success = await twitter.login(
-            username=os.getenv('TWITTER_USERNAME'),
-            password=os.getenv('TWITTER_PASSWORD'),
-            email=os.getenv('TWITTER_EMAIL')
-        )
-        
-        if not success:
+    # Start browser in VISIBLE mode and login
+    print("\n1️⃣  Starting visible browser and logging in (you can see the browser)...")
+    async with logged_in_twitter(headless=False) as twitter:
+        if twitter is None:
             print("❌ Login failed")
             return False
         
@@ -147,25 +194,22 @@ async def test_twitter_with_visibility():
         await asyncio.sleep(10)
         
         return True
-    
-    finally:
-        await twitter.close_browser()
 
 
 async def test_environment_setup():
     """Verify environment setup"""
-    print("\n" + "="*70)
-    print("🔍 Checking Environment Setup")
-    print("="*70)
-    
-    from dotenv import load_dotenv
+    print("\n".join([
+        "\n" + "="*70,
+        "🔍 Checking Environment Setup",
+        "="*70,
+    ]))
     
-    load_dotenv()
+    creds = _creds()
     
     checks = {
-        "TWITTER_USERNAME": os.getenv('TWITTER_USERNAME'),
-        "TWITTER_PASSWORD": os.getenv('TWITTER_PASSWORD'),
-        "TWITTER_EMAIL": os.getenv('TWITTER_EMAIL'),
+        "TWITTER_USERNAME": creds['username'],
+        "TWITTER_PASSWORD": creds['password'],
+        "TWITTER_EMAIL": creds['email'],
         "GROQ_API_KEY": os.getenv('GROQ_API_KEY'),
         "CHROME_PATH": os.getenv('CHROME_PATH'),
     }
@@ -182,8 +226,7 @@ async def test_environment_setup():
             print(f"{status} {var}: {value or 'Using default'}")
     
     # Check Chrome
-    import shutil
-    chrome_path = shutil.which('google-chrome-stable') or shutil.which('google-chrome')
+    chrome_path = _find_chrome()
     if chrome_path:
         print(f"✅ Chrome found at: {chrome_path}")
     else:
@@ -196,9 +239,11 @@ async def test_environment_setup():
 async def main():
     """Run all tests"""
     
-    print("\n" + "="*70)
-    print("🚀 TWITTER AUTOMATION TEST SUITE")
-    print("="*70)
+    print("\n".join([
+        "\n" + "="*70,
+        "🚀 TWITTER AUTOMATION TEST SUITE",
+        "="*70,
+    ]))
     
     # First, check environment
     print("\nRunning environment checks...")
@@ -208,6 +253,12 @@ async def main():
         print("\n❌ Environment setup incomplete. Fix the issues above and try again.")
         return
     
+    # Import Playwright and the agent stack off the event loop, side by side
+    await asyncio.gather(
+        asyncio.to_thread(importlib.import_module, 'integrations.social_media'),
+        asyncio.to_thread(importlib.import_module, 'agents.hannah'),
+    )
+    
     # Test basic automation
     print("\nRunning basic automation test...")
     automation_ok = await test_twitter_automation()
@@ -228,14 +279,28 @@ async def main():
     else:
         print("\n❌ Hannah agent test FAILED")
     
-    print("\n" + "="*70)
-    print("✅ TEST SUITE COMPLETE")
-    print("="*70)
-    print("\nNext steps:")
-    print("1. If tests passed: You're ready to use Twitter automation!")
-    print("2. If tests failed: Check media/screenshots/ for debugging info")
-    print("3. Run with visible browser: python tests/test_twitter_automation.py --visible")
-    print("="*70 + "\n")
+    print("\n".join([
+        "\n" + "="*70,
+        "✅ TEST SUITE COMPLETE",
+        "="*70,
+        "\nNext steps:",
+        "1. If tests passed: You're ready to use Twitter automation!",
+        "2. If tests failed: Check media/screenshots/ for debugging info",
+        "3. Run with visible browser: python tests/test_twitter_automation.py --visible",
+        "="*70 + "\n",
+    ]))
+
+
+async def with_pool_shutdown(coro):
+    """Run a test coroutine, then close the shared login and browser."""
+    from integrations._browser_pool import shutdown_pool
+    try:
+        return await coro
+    finally:
+        for twitter in _TWITTER.values():
+            await twitter.close_browser()
+        _TWITTER.clear()
+        await shutdown_pool()
 
 
 if __name__ == "__main__":
@@ -244,6 +309,6 @@ if __name__ == "__main__":
     # Check for command line arguments
     if "--visible" in sys.argv:
         print("\n🔍 Running with VISIBLE browser for debugging...")
-        asyncio.run(test_twitter_with_visibility())
+        _run(with_pool_shutdown(test_twitter_with_visibility()))
     else:
-        asyncio.run(main())
+        _run(with_pool_shutdown(main()))
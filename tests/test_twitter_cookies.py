@@ -17,14 +17,7 @@ Steps to make this work:
 
 Quick cookie export (paste in browser console at https://x.com):
 ```javascript
-copy(JSON.stringify(
-  document.cookie.split(';').reduce((acc, c) => {
-    const [name, value] = c.trim().split('=');
-    if(name) acc[name] = value;
-    return acc;
-  }, {}),
-  null, 2
-))
+copy(JSON.stringify(Object.fromEntries(document.cookie.split('; ').map(c => c.split(/=(.*)/s))), null, 2))
 ```
 Then paste into twitter_cookies.json file.
 """
@@ -44,10 +37,22 @@ logger = logging.getLogger('twitter_cookies')
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+try:
+    import uvloop  # Optional: faster event loop
+except ImportError:
+    _run = asyncio.run
+else:
+    if hasattr(uvloop, 'run'):
+        _run = uvloop.run
+    else:
+        # uvloop.run is new in 0.18; older releases swap the loop policy instead
+        uvloop.install()
+        _run = asyncio.run
+
 
 async def test_cookie_auth():
     """Test Twitter authentication using cookies"""
-    from integrations.twitter_cookies import TwitterPostAPI, TwitterCookieAuth
+    from integrations.twitter_cookies import TwitterPostAPI, TwitterCookieAuth, close_shared_session
     
     print("\n" + "="*70)
     print("🍪 TWITTER COOKIE-BASED AUTHENTICATION TEST")
@@ -70,14 +75,7 @@ async def test_cookie_auth():
         print("4. Open browser console (F12 → Console)")
         print("5. Paste this and press Enter:")
         print("""
-copy(JSON.stringify(
-  document.cookie.split(';').reduce((acc, c) => {
-    const [name, value] = c.trim().split('=');
-    if(name) acc[name] = value;
-    return acc;
-  }, {}),
-  null, 2
-))
+copy(JSON.stringify(Object.fromEntries(document.cookie.split('; ').map(c => c.split(/=(.*)/s))), null, 2))
 """)
         print("6. Create file: " + str(auth.cookies_file))
         print("7. Paste the copied text into that file")
@@ -104,6 +102,7 @@ copy(JSON.stringify(
             print(f"   Details: {result['details']}")
     
     await api.close()
+    await close_shared_session()
     
     print("\n" + "="*70)
     if result['success']:
@@ -117,49 +116,53 @@ copy(JSON.stringify(
     return result['success']
 
 
+_COOKIES_FILE = Path(__file__).parent.parent / 'media' / 'twitter_cookies.json'
+
+# Built and encoded once; setup_instructions() writes the bytes in one call
+_SETUP_INSTRUCTIONS = f"""
+{"="*70}
+📖 SETUP INSTRUCTIONS
+{"="*70}
+
+📁 Target location: {_COOKIES_FILE}
+
+⏱️  Manual Setup (takes 2 minutes):
+   1. Open https://x.com in your browser
+   2. Sign in with your account
+   3. Keep the page open and open DevTools (F12)
+   4. Go to Console tab
+   5. Copy & paste this code:
+
+       copy(JSON.stringify(Object.fromEntries(document.cookie.split('; ').map(c => c.split(/=(.*)/s))), null, 2))
+
+   6. Open your text editor
+   7. Right-click, Paste
+   8. Save as: {_COOKIES_FILE}
+   9. Done! Now run: python test_twitter_cookies.py
+
+🔐 Alternative: Use EditThisCookie Chrome Extension
+   1. Install from Chrome Web Store
+   2. Go to https://x.com (logged in)
+   3. Click extension → Export as JSON
+   4. Save to {_COOKIES_FILE}
+
+⚠️  IMPORTANT:
+   • Keep twitter_cookies.json PRIVATE (contains auth tokens)
+   • Don't share or commit to git
+   • Treat it like a password file
+   • Cookies may expire in weeks/months (re-login then)
+
+{"="*70}
+
+"""
+_SETUP_INSTRUCTIONS_BYTES = _SETUP_INSTRUCTIONS.encode('utf-8')
+
+
 async def setup_instructions():
     """Show setup instructions"""
-    print("\n" + "="*70)
-    print("📖 SETUP INSTRUCTIONS")
-    print("="*70)
-    
-    cookies_file = Path(__file__).parent.parent / 'media' / 'twitter_cookies.json'
-    
-    print(f"\n📁 Target location: {cookies_file}")
-    print("\n⏱️  Manual Setup (takes 2 minutes):")
-    print("   1. Open https://x.com in your browser")
-    print("   2. Sign in with your account")
-    print("   3. Keep the page open and open DevTools (F12)")
-    print("   4. Go to Console tab")
-    print("   5. Copy & paste this code:")
-    print("""
-       copy(JSON.stringify(
-         document.cookie.split(';').reduce((acc, c) => {
-           const [name, value] = c.trim().split('=');
-           if(name) acc[name] = value;
-           return acc;
-         }, {}),
-         null, 2
-       ))
-""")
-    print("   6. Open your text editor")
-    print(f"   7. Right-click, Paste")
-    print(f"   8. Save as: {cookies_file}")
-    print("   9. Done! Now run: python test_twitter_cookies.py")
-    
-    print("\n🔐 Alternative: Use EditThisCookie Chrome Extension")
-    print("   1. Install from Chrome Web Store")
-    print("   2. Go to https://x.com (logged in)")
-    print("   3. Click extension → Export as JSON")
-    print(f"   4. Save to {cookies_file}")
-    
-    print("\n⚠️  IMPORTANT:")
-    print("   • Keep twitter_cookies.json PRIVATE (contains auth tokens)")
-    print("   • Don't share or commit to git")
-    print("   • Treat it like a password file")
-    print("   • Cookies may expire in weeks/months (re-login then)")
-    
-    print("\n" + "="*70 + "\n")
+    sys.stdout.flush()
+    sys.stdout.buffer.write(_SETUP_INSTRUCTIONS_BYTES)
+    sys.stdout.buffer.flush()
 
 
 async def main():
@@ -179,4 +182,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    _run(main())
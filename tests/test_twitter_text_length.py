@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Weighted Tweet Length Test
+==========================
+
+Checks TwitterPostAPI's pre-send length check against twitter-text v3
+weights, so valid tweets near the 280 limit are not rejected locally.
+
+Run: python -m unittest tests/test_twitter_text_length.py
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from integrations.twitter_cookies import _weighted_length
+
+FAMILY = '\U0001F468\u200d\U0001F469\u200d\U0001F467\u200d\U0001F466'
+
+# (description, text, weighted length as x.com counts it)
+CASES = [
+    ('ascii', 'hello', 5),
+    ('cjk counts double', '日本語', 6),
+    ('cjk at the limit', '日' * 140, 280),
+    ('heart with VS16', '\u2764\ufe0f', 2),
+    ('skin tone modifier', '\U0001F44D\U0001F3FD', 2),
+    ('flag pair', '\U0001F1FA\U0001F1F8', 2),
+    ('zwj family', FAMILY, 2),
+    ('keycap', '1\ufe0f\u20e3', 2),
+    ('tag sequence flag', '\U0001F3F4\U000E0067\U000E0062\U000E0073\U000E0063\U000E0074\U000E007F', 2),
+    ('many family emoji', FAMILY * 25, 50),
+    ('https url', 'https://example.com/some/long/path?q=1', 23),
+    ('bare domain', 'see example.com', 4 + 23),
+    ('url before full stop', 'see example.com.', 4 + 23 + 1),
+    ('email is text', 'bob@example.com', 15),
+    ('decomposed accent', 'cafe\u0301', 4),
+    ('ascii at the limit', 'x' * 280, 280),
+]
+
+
+class WeightedLengthTest(unittest.TestCase):
+    def test_cases(self):
+        for description, text, expected in CASES:
+            with self.subTest(description):
+                self.assertEqual(_weighted_length(text), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()